@@ -7,35 +7,72 @@ It can analyze specific functions or all functions in the file.
 Supports both Intel and AT&T assembly syntax.
 """
 
+import os
+import re
 import sys
 import argparse
-import json
 from pathlib import Path
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from cfg_analyzer import (
-    CFGAssemblyParser,  # For backward compatibility
-    AssemblyParserFactory, 
-    AssemblySyntax,
-    FileType,
-    print_cfg_summary, 
-    print_cfg_detailed, 
-    export_cfg_to_dot
-)
-
-def parse_specific_function(file_path: str, function_name: str, verbose: bool = False, detailed: bool = False, syntax: str = "intel", file_type: str = "assembly"):
+# cfg_analyzer imports are deferred into the functions that need them so
+# that --help and early-error paths do not pay the package import cost
+
+def _cfg_cache_path(file_path: str, syntax: str, file_type: str) -> Path:
+    """Compute the cache file path for a parsed input file"""
+    import hashlib
+    st = os.stat(file_path)
+    key = hashlib.blake2b(
+        f"{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}|{syntax}|{file_type}".encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_root / "bakasur" / f"{key}.pkl"
+
+def _parse_file_cached(parser, file_path: str, syntax: str, file_type: str, use_cache: bool):
+    """Parse a file with the given parser, optionally caching the resulting CFGs
+
+    The cache key includes path, mtime and size, so a modified input file
+    never hits a stale entry.
+    """
+    import pickle
+
+    if not use_cache:
+        return parser.parse_file_with_cfg(file_path)
+
+    cache_path = _cfg_cache_path(file_path, syntax, file_type)
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Corrupt/incompatible cache entry - fall through to reparse
+
+    cfgs = parser.parse_file_with_cfg(file_path)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(cfgs, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass  # Caching is best-effort; never fail the parse because of it
+
+    return cfgs
+
+def parse_specific_function(file_path: str, function_name: str, verbose: bool = False, detailed: bool = False, syntax: str = "intel", file_type: str = "assembly", use_cache: bool = False):
     """Parse and analyze a specific function"""
+    from cfg_analyzer import AssemblyParserFactory, print_cfg_summary, print_cfg_detailed
+
     try:
         parser = AssemblyParserFactory.create_parser(syntax, file_type)
     except ValueError as e:
         print(f"Error: {e}")
         return None
-    
+
     try:
-        cfgs = parser.parse_file_with_cfg(file_path)
-        
+        cfgs = _parse_file_cached(parser, file_path, syntax, file_type, use_cache)
+
         if function_name not in cfgs:
             print(f"Function '{function_name}' not found in {file_path}")
             available_functions = list(cfgs.keys())
@@ -53,19 +90,24 @@ def parse_specific_function(file_path: str, function_name: str, verbose: bool =
             print_cfg_summary(cfg)
         
         if verbose and not detailed:
-            print("\nDetailed Block Information:")
-            print("-" * 40)
+            # Build the whole report in memory and flush it with one write
+            # instead of paying a flush per print call on large functions
+            buf = []
+            append = buf.append
+            append("\nDetailed Block Information:\n")
+            append("-" * 40 + "\n")
             for label, block in cfg.basic_blocks.items():
-                print(f"\nBlock: {label}")
-                print(f"  Lines: {block.start_line}-{block.end_line}")
-                print(f"  Instructions:")
+                append(f"\nBlock: {label}\n")
+                append(f"  Lines: {block.start_line}-{block.end_line}\n")
+                append("  Instructions:\n")
                 for inst in block.instructions:
                     marker = " *" if inst.is_terminator else "  "
-                    print(f"   {marker} {inst.line_number}: {inst.opcode} {inst.operands}")
+                    append(f"   {marker} {inst.line_number}: {inst.opcode} {inst.operands}\n")
                     if inst.is_terminator:
-                        print(f"      -> Terminator: {inst.terminator_type.value}")
+                        append(f"      -> Terminator: {inst.terminator_type.value}\n")
                         if inst.jump_targets:
-                            print(f"      -> Targets: {', '.join(inst.jump_targets)}")
+                            append(f"      -> Targets: {', '.join(inst.jump_targets)}\n")
+            sys.stdout.write("".join(buf))
         
         return cfg
         
@@ -73,17 +115,19 @@ def parse_specific_function(file_path: str, function_name: str, verbose: bool =
         print(f"Error parsing file: {e}")
         raise
 
-def parse_all_functions(file_path: str, summary_only: bool = True, syntax: str = "intel", file_type: str = "assembly"):
+def parse_all_functions(file_path: str, summary_only: bool = True, syntax: str = "intel", file_type: str = "assembly", use_cache: bool = False):
     """Parse and analyze all functions in the file"""
+    from cfg_analyzer import AssemblyParserFactory, print_cfg_summary
+
     try:
         parser = AssemblyParserFactory.create_parser(syntax, file_type)
     except ValueError as e:
         print(f"Error: {e}")
         return {}
-    
+
     try:
-        cfgs = parser.parse_file_with_cfg(file_path)
-        
+        cfgs = _parse_file_cached(parser, file_path, syntax, file_type, use_cache)
+
         if not cfgs:
             print(f"No functions found in {file_path}")
             return {}
@@ -91,24 +135,27 @@ def parse_all_functions(file_path: str, summary_only: bool = True, syntax: str =
         print(f"Found {len(cfgs)} function(s) in {file_path}")
         print("=" * 60)
         
-        for func_name, cfg in cfgs.items():
-            if summary_only:
-                print(f"\n{func_name}:")
-                print(f"  Blocks: {len(cfg.basic_blocks)}")
-                print(f"  Entry: {cfg.entry_block}")
-                
+        if summary_only:
+            # Accumulate the per-function summaries into one buffered write
+            buf = []
+            append = buf.append
+            for func_name, cfg in cfgs.items():
+                append(f"\n{func_name}:\n")
+                append(f"  Blocks: {len(cfg.basic_blocks)}\n")
+                append(f"  Entry: {cfg.entry_block}\n")
+
                 # Count edges
-                total_edges = sum(len(block.successors) for block in cfg.basic_blocks.values())
-                print(f"  Edges: {total_edges}")
-                
+                append(f"  Edges: {cfg.count_edges()}\n")
+
                 # Detect loops
                 loops = cfg.get_loops()
-                print(f"  Loops: {len(loops)}")
-                
+                append(f"  Loops: {len(loops)}\n")
+
                 # Exit blocks
-                exit_blocks = [label for label, block in cfg.basic_blocks.items() if block.is_exit_block]
-                print(f"  Exit blocks: {len(exit_blocks)}")
-            else:
+                append(f"  Exit blocks: {cfg.count_exit_blocks()}\n")
+            sys.stdout.write("".join(buf))
+        else:
+            for func_name, cfg in cfgs.items():
                 print(f"\n{'='*20} {func_name} {'='*20}")
                 print_cfg_summary(cfg)
         
@@ -120,22 +167,119 @@ def parse_all_functions(file_path: str, summary_only: bool = True, syntax: str =
 
 def export_function_cfg(cfg, function_name: str, output_dir: str = ".", include_instructions: bool = True, max_instructions: int = None):
     """Export a function's CFG to DOT format"""
+    from cfg_analyzer import export_cfg_to_dot
+
     output_path = Path(output_dir) / f"{function_name}_cfg.dot"
     export_cfg_to_dot(cfg, str(output_path), include_instructions=include_instructions, max_instructions=max_instructions)
     print(f"CFG exported to: {output_path}")
     print(f"To visualize: dot -Tpng {output_path} -o {function_name}_cfg.png")
 
-def export_all_cfgs(cfgs: dict, output_dir: str = ".", include_instructions: bool = True, max_instructions: int = None):
-    """Export all CFGs to DOT format"""
+def _export_one_cfg(item):
+    """Export a single CFG to DOT format (worker for export_all_cfgs)"""
+    from cfg_analyzer import export_cfg_to_dot
+
+    func_name, cfg, output_dir, include_instructions, max_instructions = item
+    dot_file = Path(output_dir) / f"{func_name}_cfg.dot"
+    export_cfg_to_dot(cfg, str(dot_file), include_instructions=include_instructions, max_instructions=max_instructions)
+    return dot_file
+
+def export_all_cfgs(cfgs: dict, output_dir: str = ".", include_instructions: bool = True, max_instructions: int = None, jobs: int = 1):
+    """Export all CFGs to DOT format, optionally in parallel"""
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
-    
-    for func_name, cfg in cfgs.items():
-        dot_file = output_path / f"{func_name}_cfg.dot"
-        export_cfg_to_dot(cfg, str(dot_file), include_instructions=include_instructions, max_instructions=max_instructions)
-        print(f"Exported {func_name} CFG to: {dot_file}")
 
-def main():
+    items = [(func_name, cfg, output_dir, include_instructions, max_instructions)
+             for func_name, cfg in cfgs.items()]
+
+    if jobs != 1 and len(items) > 1:
+        # DOT serialization is CPU-bound pure-Python work over disjoint CFGs,
+        # so a process pool gives near-linear speedup for many functions
+        from concurrent.futures import ProcessPoolExecutor
+        max_workers = jobs if jobs else os.cpu_count()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for item, dot_file in zip(items, executor.map(_export_one_cfg, items)):
+                print(f"Exported {item[0]} CFG to: {dot_file}")
+    else:
+        for item in items:
+            dot_file = _export_one_cfg(item)
+            print(f"Exported {item[0]} CFG to: {dot_file}")
+
+# CLI option tables for the fast-path parser in _fast_parse.
+# Must stay in sync with the argparse definitions in _build_arg_parser.
+_FLAG_OPTIONS = {
+    '--auto-detect': 'auto_detect',
+    '-v': 'verbose', '--verbose': 'verbose',
+    '--detailed': 'detailed',
+    '--export-dot': 'export_dot',
+    '--export-all-dot': 'export_all_dot',
+    '--no-instructions': 'no_instructions',
+    '--cache': 'cache',
+    '--json': 'json',
+}
+_VALUE_OPTIONS = {
+    '-f': ('function', str), '--function': ('function', str),
+    '-s': ('syntax', str), '--syntax': ('syntax', str),
+    '-t': ('type', str), '--type': ('type', str),
+    '--max-instructions': ('max_instructions', int),
+    '-o': ('output_dir', str), '--output-dir': ('output_dir', str),
+    '--jobs': ('jobs', int),
+}
+
+# Argparse's negative-number matcher: a leading-dash token is only a valid
+# option value when it looks like a negative number (e.g. "--jobs -1");
+# anything else dash-prefixed is an option and must not be swallowed
+_NEGATIVE_NUMBER_RE = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+def _fast_parse(argv):
+    """Fast-path command-line parser for the common invocation patterns
+
+    A single left-to-right sweep over known options, avoiding the argparse
+    setup cost for scripted batch use. Returns a populated Namespace, or
+    None on anything unexpected so the caller can fall back to argparse
+    (which then handles --help, abbreviations, '=' forms and errors).
+    """
+    args = argparse.Namespace(
+        file=None, function=None, syntax='intel', type='assembly',
+        auto_detect=False, verbose=False, detailed=False,
+        export_dot=False, export_all_dot=False, no_instructions=False,
+        max_instructions=None, output_dir='.', jobs=1, cache=False, json=False
+    )
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token in _FLAG_OPTIONS:
+            setattr(args, _FLAG_OPTIONS[token], True)
+            i += 1
+        elif token in _VALUE_OPTIONS:
+            if i + 1 >= len(argv):
+                return None
+            value = argv[i + 1]
+            if value.startswith('-') and not _NEGATIVE_NUMBER_RE.match(value):
+                # Option-like value ("-f --verbose"): argparse treats it as
+                # the next option and errors; defer to it
+                return None
+            name, convert = _VALUE_OPTIONS[token]
+            try:
+                setattr(args, name, convert(value))
+            except ValueError:
+                return None
+            i += 2
+        elif not token.startswith('-') and args.file is None:
+            args.file = token
+            i += 1
+        else:
+            # Unknown option, '=' form, abbreviation, or extra positional
+            return None
+
+    if args.file is None:
+        return None
+    if args.syntax not in ('intel', 'att') or args.type not in ('assembly', 'objdump'):
+        return None
+
+    return args
+
+def _build_arg_parser():
     parser = argparse.ArgumentParser(
         description="Parse assembly files, objdump files, or object files to build control flow graphs",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -213,19 +357,38 @@ File Types Supported:
                        help='Limit number of instructions shown per block in DOT output (default: no limit)')
     parser.add_argument('-o', '--output-dir', default='.',
                        help='Output directory for exported files')
+    parser.add_argument('--jobs', type=int, metavar='N', default=1,
+                       help='Number of worker processes for --export-all-dot (default: 1, 0 = all cores)')
+    parser.add_argument('--cache', action='store_true',
+                       help='Cache parsed CFGs under ~/.cache/bakasur keyed by file mtime (speeds up repeated queries)')
     parser.add_argument('--json', action='store_true',
                        help='Output results in JSON format')
-    
-    args = parser.parse_args()
-    
+
+    return parser
+
+def main():
+    # Try the cheap hand-rolled parser first; anything it cannot handle
+    # (--help, unknown flags, '=' forms) goes through argparse as before
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        args = _build_arg_parser().parse_args()
+
     if not Path(args.file).exists():
         print(f"Error: File '{args.file}' not found")
         sys.exit(1)
     
     # Determine file type and assembly syntax
     if args.auto_detect:
-        detected_file_type = AssemblyParserFactory.detect_file_type(args.file)
-        detected_syntax = AssemblyParserFactory.detect_syntax(args.file)
+        from cfg_analyzer import AssemblyParserFactory
+        # Read the file head once and share it between both detectors
+        # instead of re-opening the file for each detection pass
+        try:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                head = f.read(65536)
+        except Exception:
+            head = ""
+        detected_file_type = AssemblyParserFactory.detect_file_type_from_content(args.file, head)
+        detected_syntax = AssemblyParserFactory.detect_syntax_from_content(head)
         file_type = detected_file_type.value
         syntax = detected_syntax.value
         print(f"Auto-detected file type: {file_type.upper()}")
@@ -243,7 +406,7 @@ File Types Supported:
     try:
         if args.function:
             # Parse specific function
-            cfg = parse_specific_function(args.file, args.function, args.verbose, args.detailed, syntax, file_type)
+            cfg = parse_specific_function(args.file, args.function, args.verbose, args.detailed, syntax, file_type, use_cache=args.cache)
             
             if cfg and args.export_dot:
                 include_instructions = not args.no_instructions
@@ -251,19 +414,35 @@ File Types Supported:
                 
         else:
             # Parse all functions
-            cfgs = parse_all_functions(args.file, summary_only=not args.detailed, syntax=syntax, file_type=file_type)
+            cfgs = parse_all_functions(args.file, summary_only=not args.detailed, syntax=syntax, file_type=file_type, use_cache=args.cache)
             
             if cfgs and args.export_all_dot:
                 include_instructions = not args.no_instructions
-                export_all_cfgs(cfgs, args.output_dir, include_instructions, args.max_instructions)
+                export_all_cfgs(cfgs, args.output_dir, include_instructions, args.max_instructions, jobs=args.jobs)
     
     except Exception:
         # Error already printed by parse functions
         sys.exit(1)
     
     if args.json:
-        # TODO: Add JSON serialization of CFG data
-        print("\nJSON export not yet implemented")
+        from cfg_analyzer import cfg_to_dict
+
+        # Prefer orjson when installed; fall back to the stdlib encoder
+        try:
+            import orjson
+            def _dumps(obj):
+                return orjson.dumps(obj).decode('utf-8')
+        except ImportError:
+            import json
+            def _dumps(obj):
+                return json.dumps(obj)
+
+        if args.function:
+            payload = cfg_to_dict(cfg) if cfg else None
+        else:
+            payload = {name: cfg_to_dict(c) for name, c in cfgs.items()}
+
+        sys.stdout.write(_dumps(payload) + "\n")
 
 if __name__ == "__main__":
     main()
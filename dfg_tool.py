@@ -110,6 +110,8 @@ Examples:
                        help='Output file name for SVG (default: dataflow)')
     parser.add_argument('--svg', action='store_true',
                        help='Generate SVG dependency graph')
+    parser.add_argument('--fast-layout', action='store_true',
+                       help='Cap Graphviz layout iterations for faster SVG rendering')
     parser.add_argument('--demo', action='store_true',
                        help='Run with demo assembly code')
     parser.add_argument('--list-archs', action='store_true',
@@ -165,29 +167,21 @@ Examples:
         print(f"Registers: {arch_info['total_registers']} total")
         print()
         
-        # Create visualizer based on style
-        if args.style == 'enhanced':
-            visualizer = DataFlowVisualizer()
-            visualizer.analyzer = analyzer  # Use our configured analyzer
-            visualizer.analyze_and_print(assembly_text, style="enhanced")
-        elif args.style == 'comprehensive':
-            visualizer = DataFlowVisualizer() 
-            visualizer.analyzer = analyzer  # Use our configured analyzer
-            visualizer.analyze_and_print(assembly_text, style="comprehensive")
-        else:  # classic
-            visualizer = DataFlowVisualizer()
-            visualizer.analyzer = analyzer  # Use our configured analyzer
-            visualizer.analyze_and_print(assembly_text, style="classic")
-        
+        # One visualizer serves both the printed report and the SVG path;
+        # analysis results are cached on the parsed instructions, so the SVG
+        # render reuses the work done for the report
+        visualizer = DataFlowVisualizer()
+        visualizer.analyzer = analyzer  # Use our configured analyzer
+        visualizer.analyze_and_print(assembly_text, style=args.style)
+
         # Generate SVG if requested
         if args.svg:
             try:
-                visualizer = DataFlowVisualizer()
-                visualizer.analyzer = analyzer  # Use our configured analyzer
                 output_path = visualizer.create_dependency_graph(
-                    assembly_text, 
+                    assembly_text,
                     args.output,
-                    enhanced=(args.style == 'enhanced')
+                    enhanced=(args.style == 'enhanced'),
+                    fast_layout=args.fast_layout
                 )
                 print(f"\nSVG dependency graph saved to: {output_path}")
                 print("Open the SVG file in a web browser to view the interactive graph.")
@@ -23,7 +23,7 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     
-    python_requires=">=3.6",
+    python_requires=">=3.10",
     
     install_requires=[
         # No external dependencies - uses only standard library
@@ -51,10 +51,6 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Analysis Tools",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
@@ -15,7 +15,7 @@ from .parser_factory import AssemblyParserFactory, AssemblySyntax, FileType, cre
 
 # Original imports
 from .models import Instruction, BasicBlock, ControlFlowGraph, TerminatorType
-from .visualization import export_cfg_to_dot, print_cfg_summary, print_cfg_detailed
+from .visualization import export_cfg_to_dot, print_cfg_summary, print_cfg_detailed, cfg_to_dict
 
 __version__ = "1.2.0"
 __author__ = "CFG Analysis Session"
@@ -43,5 +43,6 @@ __all__ = [
     # Visualization
     'export_cfg_to_dot',
     'print_cfg_summary',
-    'print_cfg_detailed'
+    'print_cfg_detailed',
+    'cfg_to_dict'
 ]
@@ -5,6 +5,7 @@ Specialized parser for AT&T assembly syntax.
 """
 
 import re
+import sys
 from typing import List
 from .base_parser import BaseAssemblyParser
 
@@ -30,6 +31,11 @@ class ATTAssemblyParser(BaseAssemblyParser):
         
         # AT&T syntax jump target pattern - targets can be with or without $ prefix
         self.jump_target_pattern = re.compile(r'[\$]?\.[A-Za-z_][A-Za-z0-9_]*|[\$]?[A-Za-z_][A-Za-z0-9_]*')
+
+        # Combined target matcher for _extract_jump_targets, compiled once:
+        # $.label / .label anywhere, $label / label at end or before a comma
+        self._att_target_pattern = re.compile(
+            r'\$?(?:\.[A-Za-z_][A-Za-z0-9_]*|[A-Za-z_][A-Za-z0-9_]*(?=\s*$|,))')
     
     def _parse_operands(self, operands: str) -> str:
         """Parse AT&T syntax operands and normalize them"""
@@ -43,28 +49,21 @@ class ATTAssemblyParser(BaseAssemblyParser):
     
     def _extract_jump_targets(self, operands: str) -> List[str]:
         """Extract jump target labels from AT&T syntax operands"""
-        targets = []
-        
         # In AT&T syntax, jump targets can appear as:
         # - .label
         # - label
         # - $label (immediate addressing)
-        
+
         # Remove common AT&T prefixes and suffixes for jump target detection
         cleaned_operands = operands.strip()
-        
-        # Handle different AT&T jump target formats
-        att_target_patterns = [
-            re.compile(r'\$?\.[A-Za-z_][A-Za-z0-9_]*'),  # $.label or .label
-            re.compile(r'\$?[A-Za-z_][A-Za-z0-9_]*(?=\s*$|,)'),  # $label or label (at end or before comma)
-        ]
-        
-        for pattern in att_target_patterns:
-            matches = pattern.findall(cleaned_operands)
-            for match in matches:
-                # Clean up the target
-                target = match.lstrip('$').lstrip('.')
-                if target and target not in targets:  # Avoid duplicates
-                    targets.append(target)
-        
-        return targets
+
+        # Insertion-ordered dict gives O(1) dedup; a list membership test
+        # would rescan the targets found so far for every match
+        seen = {}
+        for match in self._att_target_pattern.findall(cleaned_operands):
+            # Clean up the target
+            target = match.lstrip('$').lstrip('.')
+            if target:
+                seen[sys.intern(target)] = None
+
+        return list(seen)
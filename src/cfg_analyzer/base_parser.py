@@ -4,15 +4,52 @@ Base Assembly Parser
 Contains common functionality shared between Intel and AT&T assembly parsers.
 """
 
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List, Dict, Set, Optional, Tuple
 from abc import ABC, abstractmethod
 from .models import ControlFlowGraph, BasicBlock, Instruction, TerminatorType
 
 
+def _build_cfg_worker(parser_cls, func_name: str, func_lines: List[str],
+                      base_line_num: int) -> ControlFlowGraph:
+    """Build one function's CFG in a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it; the parser is
+    reconstructed from its class since compiled patterns and bound methods
+    do not cross process boundaries. Functions are independent once their
+    line ranges are known, so this parallelizes cleanly.
+    """
+    parser = parser_cls()
+    classified = parser._classify_lines(func_lines)
+    return parser._build_cfg_for_function(func_name, func_lines, base_line_num, classified)
+
+# Line roles assigned by _classify_lines: one combined-regex pass over the
+# file replaces the separate function-directive, label, terminator and
+# instruction scans that previously each re-matched every line
+_OTHER = 0
+_FUNC_TYPE = 1
+_FUNC_END = 2
+_LOCAL_LABEL = 3
+_GLOBAL_LABEL = 4
+_INSTRUCTION = 5
+
+
 class BaseAssemblyParser(ABC):
     """Base class for assembly parsers with common functionality"""
-    
+
+    # Files at or above this size are memory-mapped instead of read into an
+    # intermediate bytes buffer, halving peak memory during the decode
+    _MMAP_THRESHOLD = 8 * 1024 * 1024
+
+    # Build per-function CFGs in worker processes once a file has this many
+    # functions; below it the pool spawn cost outweighs the parallelism
+    _PARALLEL_MIN_FUNCTIONS = 32
+
     def __init__(self):
         # Common directive patterns
         self.directive_pattern = re.compile(r'^\s*\.')
@@ -28,14 +65,46 @@ class BaseAssemblyParser(ABC):
         
         # Jump target pattern - to be overridden by subclasses if needed
         self.jump_target_pattern = re.compile(r'\.[A-Za-z_][A-Za-z0-9_]*')
-        
+
+        # Combined classifier: one anchored alternation assigns every line
+        # its role (function directive / function end / label / instruction)
+        # in a single match call. The leading \s* eats indentation, so the
+        # classification pass never needs line.strip().
+        # Groups: 1 function name, 2+3 .Lfunc_end label/colon,
+        #         4 label dot prefix, 5 label name, 6 opcode, 7 operands
+        self._line_classifier = re.compile(
+            r'^\s*(?:\.type\s+([^,\s]+)\s*,\s*@function'
+            r'|\.(Lfunc_end[A-Za-z0-9_]*)(:?)'
+            r'|(\.?)([A-Za-z_][A-Za-z0-9_]*):'
+            r'|([a-zA-Z][a-zA-Z0-9]*)\s*(.*))')
+
+
         # Initialize syntax-specific patterns in subclasses
         self._init_syntax_specific_patterns()
-    
+        self._build_opcode_tables()
+
     @abstractmethod
     def _init_syntax_specific_patterns(self):
         """Initialize syntax-specific patterns (Intel vs AT&T)"""
         pass
+
+    def _build_opcode_tables(self):
+        """Build the opcode -> terminator type dispatch table
+
+        Collapses the per-opcode membership checks against three separate
+        sets into a single dict lookup in the hot classification path.
+        Must be re-run if the terminator opcode sets change after init.
+        """
+        terminator_types = {}
+        for opcode in self.unconditional_jumps:
+            terminator_types[opcode] = TerminatorType.UNCONDITIONAL_JUMP
+        for opcode in self.conditional_jumps:
+            terminator_types[opcode] = TerminatorType.CONDITIONAL_JUMP
+        for opcode in self.return_instructions:
+            terminator_types[opcode] = TerminatorType.RETURN
+        self._terminator_types = terminator_types
+        # Bound method saves the attribute walk in per-instruction callers
+        self._terminator_get = terminator_types.get
     
     @abstractmethod
     def _parse_operands(self, operands: str) -> str:
@@ -55,74 +124,161 @@ class BaseAssemblyParser(ABC):
             Dictionary mapping function names to their CFGs
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            if os.path.getsize(file_path) >= self._MMAP_THRESHOLD:
+                # Large dumps: decode straight out of a memory map so no
+                # intermediate bytes copy of the whole file is made
+                with open(file_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, 'madvise'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        lines = str(mm, 'utf-8').splitlines()
+            else:
+                # Read the whole file in one request and split afterwards - a
+                # single bulk read is noticeably faster than per-line reads
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    lines = f.read().splitlines()
         except FileNotFoundError:
             raise FileNotFoundError(f"Assembly file '{file_path}' not found")
         except Exception as e:
             raise IOError(f"Error reading file '{file_path}': {e}")
         
-        functions = self._parse_functions_with_lines(lines)
+        # Classify every line once; the function scan, block-boundary scan
+        # and instruction parsing below are all lookups into these arrays
+        # instead of fresh regex passes over the same lines
+        kinds, payloads = self._classify_lines(lines)
+        functions = self._parse_functions_with_lines(lines, (kinds, payloads))
         cfgs = {}
-        
+
+        if len(functions) >= self._PARALLEL_MIN_FUNCTIONS:
+            # Functions are independent after their line ranges are known;
+            # fan the per-function builds out across processes. map()
+            # preserves function order, so the result dict is identical to
+            # the serial path.
+            names = [f[0] for f in functions]
+            slices = [lines[s-1:e] for _, s, e in functions]
+            starts = [s for _, s, _ in functions]
+            with ProcessPoolExecutor() as executor:
+                for func_name, cfg in zip(names, executor.map(
+                        _build_cfg_worker, repeat(type(self)), names, slices, starts)):
+                    cfgs[func_name] = cfg
+            return cfgs
+
         for func_name, start_line, end_line in functions:
             func_lines = lines[start_line-1:end_line]
-            cfg = self._build_cfg_for_function(func_name, func_lines, start_line)
+            classified = (kinds[start_line-1:end_line], payloads[start_line-1:end_line])
+            cfg = self._build_cfg_for_function(func_name, func_lines, start_line, classified)
             cfgs[func_name] = cfg
-        
+
         return cfgs
-    
-    def _parse_functions_with_lines(self, lines: List[str]) -> List[Tuple[str, int, int]]:
+
+    def _classify_lines(self, lines: List[str]) -> Tuple[List[int], List]:
+        """Assign every line a role in a single combined-regex pass
+
+        Returns parallel (kinds, payloads) lists indexed by line number.
+        The payload is the function name for _FUNC_TYPE, the label text
+        (without the dot) for labels and labelled _FUNC_END lines, an
+        (opcode, operands, terminator_type) triple for _INSTRUCTION, and
+        None otherwise. Opcodes are lowercased, interned and classified
+        against the terminator table here, so downstream passes never
+        touch the line text or the opcode sets again.
+        """
+        kinds = []
+        payloads = []
+        kinds_append = kinds.append
+        payloads_append = payloads.append
+        match = self._line_classifier.match
+        terminator_get = self._terminator_types.get
+        # map() drives the per-line match calls from C instead of
+        # dispatching a bytecode-level call per iteration
+        for m in map(match, lines):
+            if m is None:
+                kinds_append(_OTHER)
+                payloads_append(None)
+                continue
+            g = m.group
+            if g(1) is not None:
+                kinds_append(_FUNC_TYPE)
+                payloads_append(g(1))
+            elif g(2) is not None:
+                kinds_append(_FUNC_END)
+                # .Lfunc_end lines carry a label when written with a colon;
+                # they then also delimit a (label-only) basic block
+                payloads_append(g(2) if g(3) else None)
+            elif g(5) is not None:
+                kinds_append(_LOCAL_LABEL if g(4) else _GLOBAL_LABEL)
+                payloads_append(g(5))
+            else:
+                kinds_append(_INSTRUCTION)
+                opcode = sys.intern(g(6).lower())
+                payloads_append((opcode, g(7), terminator_get(opcode)))
+        return kinds, payloads
+
+    def _parse_functions_with_lines(self, lines: List[str],
+                                    classified: Tuple[List[int], List] = None) -> List[Tuple[str, int, int]]:
         """Parse functions and return their line ranges"""
+        if classified is None:
+            classified = self._classify_lines(lines)
+        kinds, payloads = classified
         functions = []
+        n = len(kinds)
         i = 0
-        
-        while i < len(lines):
-            line = lines[i].strip()
-            
+
+        while i < n:
             # Check for .type directive ending with @function
-            function_name = self._extract_function_name_from_type(line)
-            if function_name:
-                # Look for function label on next line
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if self._is_function_label(next_line, function_name):
-                        start_line = i + 1  # 1-indexed, include the label
-                        
-                        # Find the end of function
-                        end_line = self._find_function_end(lines, i + 2)
-                        
-                        if end_line:
-                            functions.append((function_name, start_line, end_line))
-                            i = end_line
-                        else:
-                            # Function without explicit end
-                            functions.append((function_name, start_line, len(lines)))
-                            i = len(lines)
-                    else:
-                        i += 1
-                else:
-                    i += 1
-            else:
-                i += 1
-        
+            if kinds[i] == _FUNC_TYPE:
+                function_name = payloads[i]
+                # Look for function label on next line: the common case is a
+                # plain label matching the name; odd spellings fall back to
+                # the escaped-name regex check
+                if i + 1 < n and (
+                        (kinds[i + 1] == _GLOBAL_LABEL and payloads[i + 1] == function_name)
+                        or self._is_function_label(lines[i + 1].strip(), function_name)):
+                    start_line = i + 1  # 1-indexed, include the label
+
+                    # Find the end of function
+                    end_line = None
+                    for j in range(i + 2, n):
+                        if kinds[j] == _FUNC_END:
+                            end_line = j + 1
+                            break
+
+                    if end_line:
+                        functions.append((function_name, start_line, end_line))
+                        i = end_line
+                        continue
+                    # Function without explicit end
+                    functions.append((function_name, start_line, n))
+                    break
+            i += 1
+
         return functions
-    
-    def _build_cfg_for_function(self, func_name: str, func_lines: List[str], base_line_num: int) -> ControlFlowGraph:
+
+    def _build_cfg_for_function(self, func_name: str, func_lines: List[str], base_line_num: int,
+                                classified: Tuple[List[int], List] = None) -> ControlFlowGraph:
         """Build CFG for a single function"""
         cfg = ControlFlowGraph(func_name, "")
-        
-        # Step 1: Identify basic block boundaries
-        block_starts = self._find_basic_block_starts(func_lines)
-        
-        # Step 2: Create basic blocks
-        blocks = self._create_basic_blocks(func_lines, block_starts, base_line_num)
-        
-        # Step 3: Set entry block (first block with a label or first instruction)
-        if blocks:
-            first_block = next(iter(blocks.keys()))
-            cfg.entry_block = first_block
-        
+
+        if classified is not None:
+            # Steps 1+2 via the precomputed line roles
+            kinds, payloads = classified
+            block_starts = self._block_starts_from_classified(kinds, payloads)
+            blocks, entry_label = self._blocks_from_classified(func_lines, kinds, payloads,
+                                                               block_starts, base_line_num)
+        else:
+            # Regex path kept for subclasses (objdump) that classify their
+            # own line format
+            # Step 1: Identify basic block boundaries
+            block_starts = self._find_basic_block_starts(func_lines)
+
+            # Step 2: Create basic blocks
+            blocks, entry_label = self._create_basic_blocks(func_lines, block_starts, base_line_num)
+
+        # Step 3: Set entry block (first block with a label or first
+        # instruction), reported by the builder rather than re-derived from
+        # dict insertion order
+        if entry_label:
+            cfg.entry_block = entry_label
+
         cfg.basic_blocks = blocks
         
         # Step 4: Build edges between blocks
@@ -136,37 +292,47 @@ class BaseAssemblyParser(ABC):
     def _find_basic_block_starts(self, lines: List[str]) -> Set[int]:
         """Find all line numbers that start basic blocks"""
         starts = set()
-        
+
         # First line is always a block start
         starts.add(0)
-        
+
+        # Carry the previous line's terminator status forward so each line
+        # is matched once, not again as the next iteration's predecessor
+        prev_terminates = False
         for i, line in enumerate(lines):
             stripped = line.strip()
-            
+
             # Labels start new blocks
             if self.local_label_pattern.match(stripped):
                 starts.add(i)
-            
+
             # Instructions after terminators start new blocks
-            if i > 0:
-                prev_line = lines[i-1].strip()
-                if self._is_terminator_instruction(prev_line):
-                    starts.add(i)
-        
+            if prev_terminates:
+                starts.add(i)
+            prev_terminates = self._is_terminator_instruction(stripped)
+
         return starts
     
-    def _create_basic_blocks(self, lines: List[str], starts: Set[int], base_line_num: int) -> Dict[str, BasicBlock]:
-        """Create basic blocks from line ranges"""
+    def _create_basic_blocks(self, lines: List[str], starts: Set[int],
+                             base_line_num: int) -> Tuple[Dict[str, BasicBlock], Optional[str]]:
+        """Create basic blocks from line ranges
+
+        Returns the block dict plus the entry block's label, captured here
+        so the caller does not depend on dict insertion order.
+        """
         blocks = {}
+        entry_label = None
         start_list = sorted(starts)
         
         for i, start in enumerate(start_list):
             end = start_list[i + 1] - 1 if i + 1 < len(start_list) else len(lines) - 1
             
-            # Find block label
+            # Find block label - interned since the same label strings recur
+            # as successor/predecessor entries and dict keys
             label = self._get_block_label(lines, start)
             if not label:
                 label = f"bb_{start}"
+            label = sys.intern(label)
             
             # Create basic block
             block = BasicBlock(
@@ -182,10 +348,78 @@ class BaseAssemblyParser(ABC):
                     if instruction:
                         block.instructions.append(instruction)
             
+            if entry_label is None:
+                entry_label = label
             blocks[label] = block
-        
-        return blocks
-    
+
+        return blocks, entry_label
+
+    def _block_starts_from_classified(self, kinds: List[int], payloads: List) -> Set[int]:
+        """Find basic block start lines from the precomputed line roles"""
+        starts = {0}
+        prev_terminates = False
+
+        for i, kind in enumerate(kinds):
+            # Labels start new blocks (including a labelled .Lfunc_end)
+            if kind == _LOCAL_LABEL or (kind == _FUNC_END and payloads[i] is not None):
+                starts.add(i)
+
+            # Instructions after terminators start new blocks
+            if prev_terminates:
+                starts.add(i)
+            prev_terminates = kind == _INSTRUCTION and payloads[i][2] is not None
+
+        return starts
+
+    def _blocks_from_classified(self, lines: List[str], kinds: List[int], payloads: List,
+                                starts: Set[int], base_line_num: int) -> Tuple[Dict[str, BasicBlock], Optional[str]]:
+        """Create basic blocks using the precomputed line roles
+
+        The inner loop reads the (opcode, operands) payloads directly, so no
+        line is stripped or regex-matched a second time. Returns the block
+        dict plus the entry block's label, as _create_basic_blocks does.
+        """
+        blocks = {}
+        entry_label = None
+        start_list = sorted(starts)
+
+        for i, start in enumerate(start_list):
+            end = start_list[i + 1] - 1 if i + 1 < len(start_list) else len(lines) - 1
+
+            kind = kinds[start]
+            if kind in (_LOCAL_LABEL, _GLOBAL_LABEL) or (kind == _FUNC_END and payloads[start] is not None):
+                label = sys.intern(payloads[start])
+            else:
+                label = sys.intern(f"bb_{start}")
+
+            block = BasicBlock(
+                label=label,
+                start_line=base_line_num + start,
+                end_line=base_line_num + end
+            )
+
+            append = block.instructions.append
+            for line_idx in range(start, min(end + 1, len(lines))):
+                if kinds[line_idx] != _INSTRUCTION:
+                    continue
+                opcode, operands, terminator_type = payloads[line_idx]
+                operands = operands.strip()
+                append(Instruction(
+                    line_number=base_line_num + line_idx,
+                    opcode=opcode,
+                    operands=self._parse_operands(operands),
+                    raw_line=lines[line_idx],
+                    is_terminator=terminator_type is not None,
+                    terminator_type=terminator_type,
+                    jump_targets=self._extract_jump_targets(operands) if terminator_type is not None else []
+                ))
+
+            if entry_label is None:
+                entry_label = label
+            blocks[label] = block
+
+        return blocks, entry_label
+
     def _get_block_label(self, lines: List[str], start_idx: int) -> Optional[str]:
         """Extract label from block start"""
         if start_idx < len(lines):
@@ -199,12 +433,15 @@ class BaseAssemblyParser(ABC):
         """Parse a single instruction"""
         stripped = line.strip()
         
-        # Skip empty lines, comments, and directives
-        if not stripped or stripped.startswith('#') or stripped.startswith('.'):
+        # Skip empty lines, comments, and directives (single char test
+        # instead of two startswith calls)
+        if not stripped or stripped[0] in '#.':
             return None
-        
-        # Skip labels
-        if ':' in stripped and not ' ' in stripped.split(':')[0]:
+
+        # Skip labels: a colon with no space before it. str.find keeps this
+        # to integer comparisons where split(':') allocated a list per line
+        colon = stripped.find(':')
+        if colon >= 0 and stripped.find(' ', 0, colon) < 0:
             return None
         
         # Parse instruction
@@ -212,15 +449,19 @@ class BaseAssemblyParser(ABC):
         if not match:
             return None
         
-        opcode = match.group(1).lower()
+        # Intern the opcode: only a few hundred distinct opcodes exist, so
+        # this collapses millions of duplicate strings on large inputs and
+        # makes the classification dict lookups hit the cached hash
+        opcode = sys.intern(match.group(1).lower())
         operands = match.group(2).strip() if match.group(2) else ""
         
         # Normalize operands based on syntax
         normalized_operands = self._parse_operands(operands)
         
-        # Determine if this is a terminator
-        is_terminator = self._is_terminator_opcode(opcode)
-        terminator_type = self._get_terminator_type(opcode)
+        # Determine if this is a terminator: one dict probe yields both the
+        # predicate and the type
+        terminator_type = self._terminator_get(opcode)
+        is_terminator = terminator_type is not None
         jump_targets = self._extract_jump_targets(operands) if is_terminator else []
         
         return Instruction(
@@ -244,24 +485,24 @@ class BaseAssemblyParser(ABC):
     
     def _is_terminator_opcode(self, opcode: str) -> bool:
         """Check if opcode is a terminator"""
-        return (opcode in self.unconditional_jumps or 
-                opcode in self.conditional_jumps or 
-                opcode in self.return_instructions)
-    
+        return opcode in self._terminator_types
+
     def _get_terminator_type(self, opcode: str) -> Optional[TerminatorType]:
         """Get the type of terminator instruction"""
-        if opcode in self.unconditional_jumps:
-            return TerminatorType.UNCONDITIONAL_JUMP
-        elif opcode in self.conditional_jumps:
-            return TerminatorType.CONDITIONAL_JUMP
-        elif opcode in self.return_instructions:
-            return TerminatorType.RETURN
-        return None
+        return self._terminator_types.get(opcode)
     
     def _build_cfg_edges(self, cfg: ControlFlowGraph):
         """Build edges between basic blocks in the CFG"""
         block_list = list(cfg.basic_blocks.keys())
-        
+
+        # Map every plausible spelling of a block label to its canonical
+        # form once; resolving a jump target is then a dict hit instead of
+        # the old lstrip-and-scan over the whole block dict per edge
+        target_index = {}
+        for label in block_list:
+            target_index[label] = label
+            target_index['.' + label] = label
+
         for i, block_label in enumerate(block_list):
             block = cfg.basic_blocks[block_label]
             terminator = block.terminator
@@ -271,14 +512,14 @@ class BaseAssemblyParser(ABC):
                 if terminator.terminator_type == TerminatorType.UNCONDITIONAL_JUMP:
                     # Only jump targets
                     for target in terminator.jump_targets:
-                        target_block = self._find_target_block(target, cfg)
+                        target_block = target_index.get(target) or target_index.get(target.lstrip('.'))
                         if target_block:
                             cfg.add_edge(block_label, target_block)
                 
                 elif terminator.terminator_type == TerminatorType.CONDITIONAL_JUMP:
                     # Both jump targets and fallthrough
                     for target in terminator.jump_targets:
-                        target_block = self._find_target_block(target, cfg)
+                        target_block = target_index.get(target) or target_index.get(target.lstrip('.'))
                         if target_block:
                             cfg.add_edge(block_label, target_block)
                     
@@ -296,27 +537,6 @@ class BaseAssemblyParser(ABC):
                     next_block = block_list[i + 1]
                     cfg.add_edge(block_label, next_block)
     
-    def _find_target_block(self, target: str, cfg: ControlFlowGraph) -> Optional[str]:
-        """Find the basic block that corresponds to a jump target"""
-        # Remove leading dot if present
-        clean_target = target.lstrip('.')
-        
-        # Try exact match first
-        if clean_target in cfg.basic_blocks:
-            return clean_target
-        
-        # Try with dot prefix
-        dot_target = '.' + clean_target if not target.startswith('.') else target
-        if dot_target.lstrip('.') in cfg.basic_blocks:
-            return dot_target.lstrip('.')
-            
-        # Search through all block labels for a match
-        for block_label in cfg.basic_blocks:
-            if block_label == clean_target or block_label == target:
-                return block_label
-        
-        return None
-    
     def _extract_function_name_from_type(self, line: str) -> Optional[str]:
         """Extract function name from .type directive"""
         match = self.type_function_pattern.match(line)
@@ -324,9 +544,13 @@ class BaseAssemblyParser(ABC):
     
     def _is_function_label(self, line: str, expected_name: str) -> bool:
         """Check if line is a function label"""
-        escaped_name = re.escape(expected_name)
-        pattern = rf'^\s*{escaped_name}\s*:'
-        return bool(re.match(pattern, line))
+        # Plain string checks instead of re.escape + a per-name pattern:
+        # the regex module caches only 512 compiled patterns, so files with
+        # thousands of functions recompiled these on every call
+        stripped = line.lstrip()
+        if not stripped.startswith(expected_name):
+            return False
+        return stripped[len(expected_name):].lstrip().startswith(':')
     
     def _find_function_end(self, lines: List[str], start_index: int) -> Optional[int]:
         """Find the end line of a function"""
@@ -5,25 +5,33 @@ Specialized parser for Intel assembly syntax.
 """
 
 import re
+import sys
 from typing import List
 from .base_parser import BaseAssemblyParser
 
+# Intel syntax terminator instructions; module-level frozensets so each
+# parser instance aliases one shared immutable set instead of rebuilding
+# the literals on every construction
+_UNCONDITIONAL_JUMPS = frozenset({'jmp', 'br'})
+_CONDITIONAL_JUMPS = frozenset({
+    'je', 'jne', 'jz', 'jnz', 'jg', 'jge', 'jl', 'jle',
+    'ja', 'jae', 'jb', 'jbe', 'js', 'jns', 'jo', 'jno',
+    'jc', 'jnc', 'jp', 'jnp', 'jpe', 'jpo', 'jecxz', 'jrcxz'
+})
+_RETURN_INSTRUCTIONS = frozenset({'ret', 'retq', 'retf', 'iret', 'iretq'})
+_CALL_INSTRUCTIONS = frozenset({'call', 'callq'})
+
 
 class IntelAssemblyParser(BaseAssemblyParser):
     """Parser for Intel assembly syntax"""
-    
+
     def _init_syntax_specific_patterns(self):
         """Initialize Intel-specific patterns"""
-        # Intel syntax terminator instructions
-        self.unconditional_jumps = {'jmp', 'br'}
-        self.conditional_jumps = {
-            'je', 'jne', 'jz', 'jnz', 'jg', 'jge', 'jl', 'jle', 
-            'ja', 'jae', 'jb', 'jbe', 'js', 'jns', 'jo', 'jno',
-            'jc', 'jnc', 'jp', 'jnp', 'jpe', 'jpo', 'jecxz', 'jrcxz'
-        }
-        self.return_instructions = {'ret', 'retq', 'retf', 'iret', 'iretq'}
-        self.call_instructions = {'call', 'callq'}
-        
+        self.unconditional_jumps = _UNCONDITIONAL_JUMPS
+        self.conditional_jumps = _CONDITIONAL_JUMPS
+        self.return_instructions = _RETURN_INSTRUCTIONS
+        self.call_instructions = _CALL_INSTRUCTIONS
+
         # Intel syntax jump target pattern
         self.jump_target_pattern = re.compile(r'\.[A-Za-z_][A-Za-z0-9_]*')
     
@@ -33,12 +41,19 @@ class IntelAssemblyParser(BaseAssemblyParser):
     
     def _extract_jump_targets(self, operands: str) -> List[str]:
         """Extract jump target labels from Intel syntax operands"""
+        # Fast path: the overwhelmingly common jump operand is a single
+        # ".Lxxx" label, which plain string checks recognize without
+        # invoking the regex engine at all
+        op = operands.strip()
+        if op.startswith('.') and op.isascii() and op[1:].isidentifier():
+            return [sys.intern(op[1:])]
+
         targets = []
         matches = self.jump_target_pattern.findall(operands)
         for match in matches:
             # Remove the dot prefix if present
             target = match.lstrip('.')
-            targets.append(target)
+            targets.append(sys.intern(target))
         return targets
 
 
@@ -20,7 +20,7 @@ class TerminatorType(Enum):
     FALLTHROUGH = "fallthrough"
 
 
-@dataclass
+@dataclass(slots=True)
 class Instruction:
     """Represents a single assembly instruction"""
     line_number: int
@@ -32,7 +32,7 @@ class Instruction:
     jump_targets: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicBlock:
     """Represents a basic block in the control flow graph"""
     label: str
@@ -44,7 +44,11 @@ class BasicBlock:
     # Optimization attributes
     is_unreachable: bool = False
     background_color: str = "white"
-    
+    # Cached terminator lookup; False marks "not yet computed" since None
+    # is a valid result. Blocks are immutable once built, so edge
+    # construction and later passes share one reverse scan per block.
+    _terminator: Any = field(default=False, repr=False, compare=False)
+
     @property
     def is_entry_block(self) -> bool:
         """Check if this is an entry block (no predecessors)"""
@@ -58,107 +62,185 @@ class BasicBlock:
     @property
     def terminator(self) -> Optional[Instruction]:
         """Get the terminator instruction of this block"""
-        for inst in reversed(self.instructions):
-            if inst.is_terminator:
-                return inst
-        return None
+        cached = self._terminator
+        if cached is False:
+            cached = None
+            for inst in reversed(self.instructions):
+                if inst.is_terminator:
+                    cached = inst
+                    break
+            self._terminator = cached
+        return cached
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlFlowGraph:
     """Represents a control flow graph for a function"""
     function_name: str
     entry_block: str
     basic_blocks: Dict[str, BasicBlock] = field(default_factory=dict)
-    
+    # Lazily built (labels, label->id, successor id lists) view; see
+    # _int_adjacency
+    _adjacency: Optional[Tuple] = field(default=None, repr=False, compare=False)
+
     def add_edge(self, from_block: str, to_block: str):
         """Add an edge between two basic blocks"""
         if from_block in self.basic_blocks:
             self.basic_blocks[from_block].successors.add(to_block)
         if to_block in self.basic_blocks:
             self.basic_blocks[to_block].predecessors.add(from_block)
+        self._adjacency = None
+
+    def _int_adjacency(self) -> Tuple[List[str], Dict[str, int], List[List[int]]]:
+        """Integer-indexed adjacency view of the CFG
+
+        Returns (labels, label->id map, successor id lists). Graph
+        traversals walk these dense int lists instead of hashing label
+        strings through the block dict on every step. Built lazily and
+        cached; add_edge invalidates the cache, so callers mutating
+        successor sets directly must not hold onto a stale view.
+        """
+        adjacency = self._adjacency
+        if adjacency is None:
+            labels = list(self.basic_blocks.keys())
+            index = {label: i for i, label in enumerate(labels)}
+            successors = [[index[s] for s in self.basic_blocks[label].successors if s in index]
+                          for label in labels]
+            adjacency = self._adjacency = (labels, index, successors)
+        return adjacency
     
+    def count_edges(self) -> int:
+        """Count CFG edges with one sweep over the successor sets"""
+        return sum(len(block.successors) for block in self.basic_blocks.values())
+
+    def count_exit_blocks(self) -> int:
+        """Count exit blocks (no successors) without building an intermediate list"""
+        return sum(1 for block in self.basic_blocks.values() if not block.successors)
+
     def get_reachable_blocks(self, start_block: str = None) -> Set[str]:
         """Get all blocks reachable from start_block (or entry if None)"""
         start = start_block or self.entry_block
-        visited = set()
-        stack = [start]
-        
+        labels, index, successors = self._int_adjacency()
+        start_id = index.get(start)
+        if start_id is None:
+            return set()
+
+        # Byte-per-block visited bitmap over the integer adjacency view:
+        # the traversal indexes flat lists instead of hashing label strings
+        # through the block dict on every step
+        visited = bytearray(len(labels))
+        visited[start_id] = 1
+        stack = [start_id]
         while stack:
             block = stack.pop()
-            if block in visited or block not in self.basic_blocks:
-                continue
-            visited.add(block)
-            stack.extend(self.basic_blocks[block].successors)
-        
-        return visited
+            for successor in successors[block]:
+                if not visited[successor]:
+                    visited[successor] = 1
+                    stack.append(successor)
+
+        return {label for label, seen in zip(labels, visited) if seen}
     
     def get_loops(self) -> List[Set[str]]:
         """Detect loops in the CFG using simple back-edge detection"""
         loops = []
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(block: str, path: List[str]) -> None:
-            if block in rec_stack:
-                # Found a back edge - extract loop
-                loop_start = path.index(block)
-                loop_blocks = set(path[loop_start:])
-                loops.append(loop_blocks)
-                return
-            
-            if block in visited or block not in self.basic_blocks:
-                return
-            
-            visited.add(block)
-            rec_stack.add(block)
-            path.append(block)
-            
-            for successor in self.basic_blocks[block].successors:
-                dfs(successor, path.copy())
-            
-            rec_stack.remove(block)
-        
-        dfs(self.entry_block, [])
+        labels, index, successors = self._int_adjacency()
+        entry_id = index.get(self.entry_block)
+        if entry_id is None:
+            return loops
+
+        # Iterative DFS over the integer adjacency view: visited/rec_stack
+        # are byte flags indexed by block id, and path_index gives the O(1)
+        # slice point for each back edge. Labels are only materialized when
+        # a loop is recorded.
+        n = len(labels)
+        visited = bytearray(n)
+        rec_stack = bytearray(n)
+        path_index = [0] * n
+        visited[entry_id] = 1
+        rec_stack[entry_id] = 1
+        path = [entry_id]
+        stack = [(entry_id, iter(successors[entry_id]))]
+
+        while stack:
+            block, succ_iter = stack[-1]
+            descended = False
+            for successor in succ_iter:
+                if rec_stack[successor]:
+                    # Found a back edge - extract loop
+                    loops.append({labels[b] for b in path[path_index[successor]:]})
+                elif not visited[successor]:
+                    visited[successor] = 1
+                    rec_stack[successor] = 1
+                    path_index[successor] = len(path)
+                    path.append(successor)
+                    stack.append((successor, iter(successors[successor])))
+                    descended = True
+                    break
+            if not descended:
+                stack.pop()
+                rec_stack[block] = 0
+                path.pop()
+
         return loops
     
     def detect_back_edges(self) -> Set[Tuple[str, str]]:
-        """Detect back edges in the CFG using DFS"""
+        """Detect back edges in the CFG using iterative DFS"""
+        # Work on integer block indices instead of label strings so the DFS
+        # avoids string hashing and Python recursion on deep graphs
+        labels, index, successors = self._int_adjacency()
+
+        WHITE, GREY, BLACK = 0, 1, 2
+        color = [WHITE] * len(labels)
         back_edges = set()
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(block: str) -> None:
-            if block not in self.basic_blocks:
-                return
-                
-            visited.add(block)
-            rec_stack.add(block)
-            
-            for successor in self.basic_blocks[block].successors:
-                if successor in rec_stack:
-                    # This is a back edge (creates a loop)
-                    back_edges.add((block, successor))
-                elif successor not in visited:
-                    dfs(successor)
-            
-            rec_stack.remove(block)
-        
+
+        def visit(start: int) -> None:
+            stack = [(start, 0)]
+            color[start] = GREY
+            while stack:
+                node, succ_idx = stack[-1]
+                succs = successors[node]
+                if succ_idx < len(succs):
+                    stack[-1] = (node, succ_idx + 1)
+                    succ = succs[succ_idx]
+                    if color[succ] == GREY:
+                        # This is a back edge (creates a loop)
+                        back_edges.add((labels[node], labels[succ]))
+                    elif color[succ] == WHITE:
+                        stack.append((succ, 0))
+                        color[succ] = GREY
+                else:
+                    color[node] = BLACK
+                    stack.pop()
+
         # Start DFS from entry block
-        if self.entry_block in self.basic_blocks:
-            dfs(self.entry_block)
-            
+        if self.entry_block in index:
+            visit(index[self.entry_block])
+
         # Also check any unreachable components
-        for block_label in self.basic_blocks:
-            if block_label not in visited:
-                dfs(block_label)
-        
+        for i in range(len(labels)):
+            if color[i] == WHITE:
+                visit(i)
+
         return back_edges
     
     def optimize(self):
         """Apply optimization passes to the CFG"""
-        self._mark_unreachable_blocks()
-        self._set_block_colors()
+        # Reachability marking and coloring fused into one sweep: coloring
+        # only depends on reachability plus the pred/succ sets, so a second
+        # pass over the block dict would just re-read what this one knows
+        reachable = self.get_reachable_blocks()
+
+        for label, block in self.basic_blocks.items():
+            unreachable = label not in reachable
+            block.is_unreachable = unreachable
+            if unreachable:
+                block.background_color = "grey"
+            elif not block.predecessors:
+                block.background_color = "lightgreen"
+            elif not block.successors:
+                block.background_color = "lightcoral"
+            else:
+                block.background_color = "white"
         # Note: Loop detection is done on-demand via detect_back_edges()
     
     def print_loop_info(self):
@@ -181,24 +263,3 @@ class ControlFlowGraph:
         
         print()
     
-    def _mark_unreachable_blocks(self):
-        """Mark blocks that are unreachable from the entry block"""
-        reachable = self.get_reachable_blocks()
-        
-        for label, block in self.basic_blocks.items():
-            if label not in reachable:
-                block.is_unreachable = True
-            else:
-                block.is_unreachable = False
-    
-    def _set_block_colors(self):
-        """Set background colors for blocks based on their properties"""
-        for label, block in self.basic_blocks.items():
-            if block.is_unreachable:
-                block.background_color = "grey"
-            elif block.is_entry_block:
-                block.background_color = "lightgreen"
-            elif block.is_exit_block:
-                block.background_color = "lightcoral"
-            else:
-                block.background_color = "white"
@@ -8,8 +8,13 @@ Can automatically execute objdump on object files or parse existing dump files.
 
 import re
 import os
+import mmap
 import subprocess
+import sys
 import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from .base_parser import BaseAssemblyParser
@@ -17,10 +22,70 @@ from .intel_parser import IntelAssemblyParser
 from .att_parser import ATTAssemblyParser
 from .models import ControlFlowGraph, BasicBlock, Instruction, TerminatorType
 
+# Objdump-specific patterns, compiled once at import: every parser instance
+# shares these, and the target patterns in particular used to be recompiled
+# inside _extract_jump_targets on every terminator line
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+
+
+def _build_objdump_cfg_worker(syntax_parser_cls, opcode_sets, mappings,
+                              func_name, func_lines, base_line_num):
+    """Build one function's CFG in a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it. The parser is
+    reconstructed in the worker; the parent's opcode sets and the
+    address/label mappings from the whole-file scan are shipped across
+    since jump targets may resolve to labels outside the function's own
+    line range.
+    """
+    parser = ObjdumpParser(syntax_parser_cls() if syntax_parser_cls else None)
+    (parser.unconditional_jumps, parser.conditional_jumps,
+     parser.return_instructions, parser.call_instructions) = opcode_sets
+    parser._build_opcode_tables()
+    (parser.address_to_label, parser.label_to_address,
+     parser._norm_addr_to_label) = mappings
+    return parser._build_cfg_for_function(func_name, func_lines, base_line_num)
+
+# Final extensions (without the dot) that mark object files needing objdump
+_OBJECT_EXTS = frozenset({'o', 'obj', 'so', 'a', 'dylib', 'dll'})
+
+# Default terminator opcode sets (Intel-like, until a syntax parser is
+# attached); module-level frozensets shared by all instances
+_UNCONDITIONAL_JUMPS = frozenset({'jmp', 'jmpq', 'jmpl'})
+_CONDITIONAL_JUMPS = frozenset({
+    'je', 'jne', 'jz', 'jnz', 'jg', 'jge', 'jl', 'jle',
+    'ja', 'jae', 'jb', 'jbe', 'js', 'jns', 'jo', 'jno',
+    'jc', 'jnc', 'jp', 'jnp', 'jpe', 'jpo', 'jecxz', 'jrcxz'
+})
+_RETURN_INSTRUCTIONS = frozenset({'ret', 'retq', 'retl', 'retf', 'iret', 'iretq'})
+_CALL_INSTRUCTIONS = frozenset({'call', 'callq', 'calll'})
+
+_FILE_HEADER_RE = re.compile(r'^[^:]+:\s+file format')
+_SECTION_HEADER_RE = re.compile(r'^Disassembly of section')
+_FUNCTION_HEADER_RE = re.compile(r'^([0-9a-fA-F]+)\s+<([^>\.]+)>:')  # Functions don't start with dot
+_LABEL_HEADER_RE = re.compile(r'^([0-9a-fA-F]+)\s+<\.([^>]+)>:')      # Labels start with dot
+_INSTRUCTION_RE = re.compile(r'^\s*([0-9a-fA-F]+):\s+([a-zA-Z][a-zA-Z0-9]*)\s*(.*)')
+# Jump targets: "address <symbol>" - be specific to avoid matching hex in
+# instruction names; plain bare addresses are the fallback form
+# Jump target operand scan: a hex address optionally followed by "<symbol>".
+# One finditer pass collects both forms; symbolized targets win when present
+_TARGET_RE = re.compile(r'\b([0-9a-fA-F]+)\b(?:\s*<([^>]+)>)?')
+# Combined line classifier: one match call distinguishes function headers,
+# label headers and instruction lines instead of probing the three patterns
+# above in sequence on every line
+_LINE_RE = re.compile(
+    r'^(?:(?P<haddr>[0-9a-fA-F]+)\s+<(?:\.(?P<label>[^>]+)|(?P<func>[^>.]+))>:'
+    r'|\s*(?P<iaddr>[0-9a-fA-F]+):\s+(?P<opcode>[a-zA-Z][a-zA-Z0-9]*)\s*(?P<operands>.*))'
+)
+
 
 class ObjdumpParser(BaseAssemblyParser):
     """Parser for objdump output files"""
-    
+
+    # Overall deadline for an objdump invocation, in seconds
+    _OBJDUMP_TIMEOUT = 30
+
+
     def __init__(self, syntax_parser=None):
         """
         Initialize objdump parser with a syntax-specific parser.
@@ -33,49 +98,63 @@ class ObjdumpParser(BaseAssemblyParser):
         self.syntax_parser = syntax_parser
         self.address_to_label = {}  # Map addresses to labels
         self.label_to_address = {}  # Map labels to addresses
+        self._norm_addr_to_label = {}  # Zero-stripped addresses to labels
         
-        # Objdump-specific patterns
-        self.file_header_pattern = re.compile(r'^[^:]+:\s+file format')
-        self.section_header_pattern = re.compile(r'^Disassembly of section')
-        self.function_header_pattern = re.compile(r'^([0-9a-fA-F]+)\s+<([^>\.]+)>:')  # Functions don't start with dot
-        self.label_header_pattern = re.compile(r'^([0-9a-fA-F]+)\s+<\.([^>]+)>:')      # Labels start with dot
-        self.instruction_pattern = re.compile(r'^\s*([0-9a-fA-F]+):\s+([a-zA-Z][a-zA-Z0-9]*)\s*(.*)')
+        # Objdump-specific patterns (module-level constants, aliased per
+        # instance for the existing self.* call sites)
+        self.file_header_pattern = _FILE_HEADER_RE
+        self.section_header_pattern = _SECTION_HEADER_RE
+        self.function_header_pattern = _FUNCTION_HEADER_RE
+        self.label_header_pattern = _LABEL_HEADER_RE
+        self.instruction_pattern = _INSTRUCTION_RE
         
         # Initialize with default syntax patterns (will be overridden if syntax_parser provided)
         self._init_syntax_specific_patterns()
     
     def _init_syntax_specific_patterns(self):
         """Initialize default syntax patterns (Intel-like)"""
-        self.unconditional_jumps = {'jmp', 'jmpq', 'jmpl'}
-        self.conditional_jumps = {
-            'je', 'jne', 'jz', 'jnz', 'jg', 'jge', 'jl', 'jle', 
-            'ja', 'jae', 'jb', 'jbe', 'js', 'jns', 'jo', 'jno',
-            'jc', 'jnc', 'jp', 'jnp', 'jpe', 'jpo', 'jecxz', 'jrcxz'
-        }
-        self.return_instructions = {'ret', 'retq', 'retl', 'retf', 'iret', 'iretq'}
-        self.call_instructions = {'call', 'callq', 'calll'}
+        self.unconditional_jumps = _UNCONDITIONAL_JUMPS
+        self.conditional_jumps = _CONDITIONAL_JUMPS
+        self.return_instructions = _RETURN_INSTRUCTIONS
+        self.call_instructions = _CALL_INSTRUCTIONS
     
     def _auto_detect_syntax(self, lines: List[str]) -> str:
         """Auto-detect assembly syntax from objdump output"""
-        # Look at the first few instructions to detect syntax
+        # Look at the first few instructions to detect syntax. Plain string
+        # scans recognize "addr: opcode operands" lines without the regex
+        # engine: hex digits, a colon, mandatory whitespace, then an
+        # ASCII-alphanumeric opcode.
         att_indicators = 0
         intel_indicators = 0
-        
+
         for line in lines[:20]:
-            inst_match = self.instruction_pattern.match(line)
-            if inst_match:
-                operands = inst_match.group(3).strip()
-                
-                # AT&T syntax indicators
-                if '%' in operands:  # Register syntax
-                    att_indicators += 2
-                if '$' in operands:  # Immediate syntax
-                    att_indicators += 1
-                
-                # Intel syntax indicators (less definitive in objdump)
-                if operands and not ('%' in operands or '$' in operands):
-                    intel_indicators += 1
-        
+            stripped = line.lstrip()
+            colon = stripped.find(':')
+            if colon <= 0 or not all(c in _HEX_DIGITS for c in stripped[:colon]):
+                continue
+            rest = stripped[colon + 1:]
+            after = rest.lstrip()
+            if len(after) == len(rest) or not after:
+                continue
+            first = after[0]
+            if not ('a' <= first <= 'z' or 'A' <= first <= 'Z'):
+                continue
+            k = 1
+            n = len(after)
+            while k < n and after[k].isascii() and after[k].isalnum():
+                k += 1
+            operands = after[k:].strip()
+
+            # AT&T syntax indicators
+            if '%' in operands:  # Register syntax
+                att_indicators += 2
+            if '$' in operands:  # Immediate syntax
+                att_indicators += 1
+
+            # Intel syntax indicators (less definitive in objdump)
+            if operands and not ('%' in operands or '$' in operands):
+                intel_indicators += 1
+
         return "att" if att_indicators > intel_indicators else "intel"
     
     def _setup_syntax_parser(self, lines: List[str]):
@@ -92,6 +171,7 @@ class ObjdumpParser(BaseAssemblyParser):
             self.conditional_jumps = self.syntax_parser.conditional_jumps
             self.return_instructions = self.syntax_parser.return_instructions
             self.call_instructions = self.syntax_parser.call_instructions
+            self._build_opcode_tables()
     
     def _parse_operands(self, operands: str) -> str:
         """Delegate operand parsing to syntax parser"""
@@ -101,60 +181,58 @@ class ObjdumpParser(BaseAssemblyParser):
     
     def _extract_jump_targets(self, operands: str) -> List[str]:
         """Extract jump targets from objdump operands"""
+        # One scan collects "address <symbol>" targets and bare addresses
+        # together; the bare form only counts when no symbolized target
+        # exists, and very short bare addresses are skipped since they are
+        # usually register offsets
         targets = []
-        
-        # Objdump shows targets as addresses with optional symbols
-        # Format: "address <symbol>" - be more specific to avoid matching hex in instruction names
-        target_pattern = re.compile(r'\b([0-9a-fA-F]+)\s*<([^>]+)>')
-        matches = target_pattern.findall(operands)
-        
-        for address, symbol in matches:
-            # Try to resolve to a known label first
-            resolved_label = self._resolve_address_to_label(address)
-            if resolved_label:
-                targets.append(resolved_label)
-            else:
-                # For objdump format like "170 <MonteCarlo_integrate+0x170>"
-                # we use the address to create our block label
-                targets.append(f"addr_{address}")
-        
-        # Also check for plain addresses without symbols
-        if not matches:
-            plain_address_pattern = re.compile(r'\b([0-9a-fA-F]+)\b')
-            plain_matches = plain_address_pattern.findall(operands)
-            for address in plain_matches:
-                # Skip very short addresses that might be register offsets
-                if len(address) >= 2:
-                    resolved_label = self._resolve_address_to_label(address)
-                    if resolved_label:
-                        targets.append(resolved_label)
-                    else:
-                        targets.append(f"addr_{address}")
-        
+        plain = []
+
+        for m in _TARGET_RE.finditer(operands):
+            address = m.group(1)
+            if m.group(2) is not None:
+                # Resolve to a known label, else synthesize one from the
+                # address as in "170 <MonteCarlo_integrate+0x170>"
+                resolved_label = self._resolve_address_to_label(address)
+                targets.append(sys.intern(resolved_label or f"addr_{address}"))
+            elif len(address) >= 2:
+                plain.append(address)
+
+        if not targets:
+            for address in plain:
+                resolved_label = self._resolve_address_to_label(address)
+                targets.append(sys.intern(resolved_label or f"addr_{address}"))
+
         return targets
     
     def _resolve_address_to_label(self, short_address: str) -> Optional[str]:
         """Resolve a short address to a known label"""
         # Try direct lookup first
-        if short_address in self.address_to_label:
-            return self.address_to_label[short_address]
-        
-        # Try with zero-padding (objdump uses short form, but we store long form)
-        for stored_addr, label in self.address_to_label.items():
-            if stored_addr.lstrip('0') == short_address.lstrip('0'):
-                return label
-        
-        return None
+        label = self.address_to_label.get(short_address)
+        if label is not None:
+            return label
+
+        # Objdump uses the short form in operands but the long zero-padded
+        # form in headers; the zero-stripped table built during the mapping
+        # scan makes this a dict probe instead of a linear search
+        return self._norm_addr_to_label.get(short_address.lstrip('0'))
     
     @staticmethod
     def is_object_file(file_path: str) -> bool:
         """Check if the file is an object file that needs objdump processing"""
-        path = Path(file_path)
-        object_extensions = {'.o', '.obj', '.so', '.a', '.dylib', '.dll'}
-        
-        # Check the final extension only (not compound extensions like .obj.dump)
-        final_extension = path.suffix.lower()
-        return final_extension in object_extensions
+        # Check the final extension only (not compound extensions like
+        # .obj.dump); a leading dot marks a hidden file, not an extension.
+        # Plain string slicing avoids constructing a Path per call.
+        path = file_path
+        while True:
+            path = path.rstrip('/')
+            if path.endswith('/.'):
+                path = path[:-1]
+            else:
+                break
+        name = os.path.basename(path)
+        dot = name.rfind('.')
+        return dot > 0 and name[dot + 1:].lower() in _OBJECT_EXTS
     
     @staticmethod
     def execute_objdump(file_path: str, function_name: Optional[str] = None) -> str:
@@ -175,16 +253,9 @@ class ObjdumpParser(BaseAssemblyParser):
         """
         if not Path(file_path).exists():
             raise FileNotFoundError(f"Object file '{file_path}' not found")
-        
-        # Build objdump command
-        cmd = ['objdump', '-d', '--no-show-raw-insn']
-        
-        # Add function-specific disassembly if requested
-        if function_name:
-            cmd.extend(['--disassemble=' + function_name])
-        
-        cmd.append(file_path)
-        
+
+        cmd = ObjdumpParser._objdump_command(file_path, function_name)
+
         try:
             # Execute objdump and capture output
             result = subprocess.run(
@@ -192,7 +263,7 @@ class ObjdumpParser(BaseAssemblyParser):
                 capture_output=True,
                 text=True,
                 check=True,
-                timeout=30  # 30 second timeout
+                timeout=ObjdumpParser._OBJDUMP_TIMEOUT
             )
             return result.stdout
             
@@ -205,6 +276,103 @@ class ObjdumpParser(BaseAssemblyParser):
         except subprocess.CalledProcessError as e:
             raise OSError(f"objdump failed with exit code {e.returncode}: {e.stderr}")
 
+    @staticmethod
+    def _objdump_command(file_path: str, function_name: Optional[str] = None) -> List[str]:
+        """Build the objdump command line"""
+        cmd = ['objdump', '-d', '--no-show-raw-insn']
+
+        # Add function-specific disassembly if requested
+        if function_name:
+            cmd.extend(['--disassemble=' + function_name])
+
+        cmd.append(file_path)
+        return cmd
+
+    @staticmethod
+    def execute_objdump_lines(file_path: str, function_name: Optional[str] = None) -> List[str]:
+        """
+        Execute objdump on object file and return its output as lines
+
+        Streams stdout from the running objdump process instead of
+        buffering the whole disassembly into one string and splitting it
+        afterwards; the parser only ever works line by line, and large
+        object files dump megabytes of text. Stderr is drained by a
+        helper thread so a noisy process cannot deadlock against the
+        stdout reader, and a timer kills the process if it exceeds the
+        30 second deadline while any pipe is still open.
+
+        Args:
+            file_path: Path to the object file
+            function_name: Optional function name to disassemble (uses --disassemble=function)
+
+        Returns:
+            List of output lines without trailing newlines
+
+        Raises:
+            FileNotFoundError: If objdump is not available or the file is missing
+            OSError: If objdump fails or times out
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Object file '{file_path}' not found")
+
+        cmd = ObjdumpParser._objdump_command(file_path, function_name)
+
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            ) as proc:
+                timed_out = threading.Event()
+
+                def expire():
+                    timed_out.set()
+                    proc.kill()
+
+                stderr_parts = []
+                stderr_reader = threading.Thread(
+                    target=lambda: stderr_parts.append(proc.stderr.read()),
+                    daemon=True)
+                # Killing the process closes its pipes, which unblocks both
+                # readers and proc.wait() if objdump hangs mid-stream
+                timer = threading.Timer(ObjdumpParser._OBJDUMP_TIMEOUT, expire)
+                stderr_reader.start()
+                timer.start()
+                try:
+                    lines = [line.rstrip('\n') for line in proc.stdout]
+                    stderr_reader.join()
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
+                if timed_out.is_set():
+                    raise OSError(f"objdump execution timed out for file: {file_path}")
+            if returncode != 0:
+                stderr = stderr_parts[0] if stderr_parts else ''
+                raise OSError(f"objdump failed with exit code {returncode}: {stderr}")
+            return lines
+
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                "objdump command not found. Please install binutils package or ensure objdump is in PATH."
+            )
+
+    def _read_dump_lines(self, file_path: str) -> List[str]:
+        """Read an objdump text file as a list of lines
+
+        Large dumps are decoded straight out of a memory map so no
+        intermediate bytes copy of the whole file is made; small ones use
+        one bulk read and split.
+        """
+        if os.path.getsize(file_path) >= self._MMAP_THRESHOLD:
+            with open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return str(mm, 'utf-8').splitlines()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read().splitlines()
+
     def parse_file_with_cfg(self, file_path: str) -> Dict[str, ControlFlowGraph]:
         """
         Parse objdump file or object file and build CFGs for all functions
@@ -221,13 +389,10 @@ class ObjdumpParser(BaseAssemblyParser):
             # Check if this is an object file that needs objdump processing
             if self.is_object_file(file_path):
                 print(f"Executing objdump on object file: {file_path}")
-                objdump_output = self.execute_objdump(file_path)
-                lines = objdump_output.splitlines()
+                lines = self.execute_objdump_lines(file_path)
             else:
                 # Read existing objdump output file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                lines = [line.rstrip() for line in lines]
+                lines = self._read_dump_lines(file_path)
                 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File '{file_path}' not found: {e}")
@@ -239,18 +404,36 @@ class ObjdumpParser(BaseAssemblyParser):
         # Setup syntax parser
         self._setup_syntax_parser(lines)
         
-        # First pass: build address/label mappings
-        self._build_address_mappings(lines)
-        
-        # Second pass: extract functions
-        functions = self._parse_functions_with_lines(lines)
+        # Single pass: build address/label mappings and extract functions
+        functions = self._scan_file(lines)
         cfgs = {}
-        
+
+        if len(functions) >= self._PARALLEL_MIN_FUNCTIONS:
+            # Functions are independent once their line ranges and the
+            # address mappings are known; fan the per-function builds out
+            # across processes as the assembly parsers do. map() preserves
+            # function order, so the result dict matches the serial path.
+            names = [f[0] for f in functions]
+            slices = [lines[s:e + 1] for _, s, e in functions]
+            starts = [s + 1 for _, s, _ in functions]
+            syntax_cls = type(self.syntax_parser) if self.syntax_parser else None
+            opcode_sets = (self.unconditional_jumps, self.conditional_jumps,
+                           self.return_instructions, self.call_instructions)
+            mappings = (self.address_to_label, self.label_to_address,
+                        self._norm_addr_to_label)
+            with ProcessPoolExecutor() as executor:
+                for func_name, cfg in zip(names, executor.map(
+                        _build_objdump_cfg_worker, repeat(syntax_cls),
+                        repeat(opcode_sets), repeat(mappings),
+                        names, slices, starts)):
+                    cfgs[func_name] = cfg
+            return cfgs
+
         for func_name, start_line, end_line in functions:
             func_lines = lines[start_line:end_line+1]
             cfg = self._build_cfg_for_function(func_name, func_lines, start_line + 1)
             cfgs[func_name] = cfg
-        
+
         return cfgs
     
     def parse_specific_function(self, file_path: str, function_name: str) -> Optional[ControlFlowGraph]:
@@ -271,13 +454,10 @@ class ObjdumpParser(BaseAssemblyParser):
             if self.is_object_file(file_path):
                 print(f"Executing objdump on object file: {file_path} for function: {function_name}")
                 # Use function-specific objdump for better performance
-                objdump_output = self.execute_objdump(file_path, function_name)
-                lines = objdump_output.splitlines()
+                lines = self.execute_objdump_lines(file_path, function_name)
             else:
                 # Read existing objdump output file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                lines = [line.rstrip() for line in lines]
+                lines = self._read_dump_lines(file_path)
                 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File '{file_path}' not found: {e}")
@@ -289,11 +469,8 @@ class ObjdumpParser(BaseAssemblyParser):
         # Setup syntax parser
         self._setup_syntax_parser(lines)
         
-        # First pass: build address/label mappings
-        self._build_address_mappings(lines)
-        
-        # Second pass: find the specific function
-        functions = self._parse_functions_with_lines(lines)
+        # Single pass: build address/label mappings and locate functions
+        functions = self._scan_file(lines)
         
         for func_name, start_line, end_line in functions:
             if func_name == function_name:
@@ -302,139 +479,120 @@ class ObjdumpParser(BaseAssemblyParser):
         
         return None
     
-    def _build_address_mappings(self, lines: List[str]):
-        """Build mappings between addresses and labels"""
-        for line in lines:
-            # Function headers
-            func_match = self.function_header_pattern.match(line)
-            if func_match:
-                address = func_match.group(1)
-                name = func_match.group(2)
-                self.address_to_label[address] = name
-                self.label_to_address[name] = address
-                continue
-            
-            # Label headers
-            label_match = self.label_header_pattern.match(line)
-            if label_match:
-                address = label_match.group(1)
-                label = label_match.group(2)
-                self.address_to_label[address] = label
-                self.label_to_address[label] = address
-    
-    def _parse_functions_with_lines(self, lines: List[str]) -> List[Tuple[str, int, int]]:
-        """Parse functions and return their line ranges"""
+    def _scan_file(self, lines: List[str]) -> List[Tuple[str, int, int]]:
+        """Build address/label mappings and locate function ranges in one pass
+
+        The address-mapping pass and the function-range pass both walk every
+        line probing the same header patterns, so they are fused into a
+        single scan. Headers always begin with a hex digit in column 0, so
+        indented instruction lines and blank lines skip the regex probes
+        entirely.
+        """
         functions = []
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
-            
-            # Look for function headers
-            func_match = self.function_header_pattern.match(line)
-            if func_match:
-                func_name = func_match.group(2)
-                start_line = i
-                
-                # Find end of function (next function or end of file)
-                end_line = len(lines) - 1
-                for j in range(i + 1, len(lines)):
-                    # End at next function
-                    if self.function_header_pattern.match(lines[j]):
-                        end_line = j - 1
-                        break
-                    # End at empty line followed by non-instruction
-                    if (not lines[j].strip() and 
-                        j + 1 < len(lines) and 
-                        not self.instruction_pattern.match(lines[j + 1]) and
-                        not self.label_header_pattern.match(lines[j + 1])):
-                        end_line = j - 1
-                        break
-                
-                functions.append((func_name, start_line, end_line))
-                i = end_line + 1
-            else:
-                i += 1
-        
+        n = len(lines)
+        open_name = None
+        open_start = 0
+        func_match = _FUNCTION_HEADER_RE.match
+        label_match = _LABEL_HEADER_RE.match
+        inst_match = _INSTRUCTION_RE.match
+        address_to_label = self.address_to_label
+        label_to_address = self.label_to_address
+        norm_setdefault = self._norm_addr_to_label.setdefault
+
+        for i, line in enumerate(lines):
+            first = line[:1]
+            if first and first in _HEX_DIGITS:
+                m = func_match(line)
+                if m:
+                    address = m.group(1)
+                    name = m.group(2)
+                    address_to_label[address] = name
+                    label_to_address[name] = address
+                    norm_setdefault(address.lstrip('0'), name)
+                    # A new function header closes the previous function
+                    if open_name is not None:
+                        functions.append((open_name, open_start, i - 1))
+                    open_name = name
+                    open_start = i
+                    continue
+                m = label_match(line)
+                if m:
+                    address = m.group(1)
+                    label = m.group(2)
+                    address_to_label[address] = label
+                    label_to_address[label] = address
+                    norm_setdefault(address.lstrip('0'), label)
+                continue
+
+            # End at empty line followed by non-instruction
+            if (open_name is not None and not line.strip() and
+                    i + 1 < n and
+                    not inst_match(lines[i + 1]) and
+                    not label_match(lines[i + 1])):
+                functions.append((open_name, open_start, i - 1))
+                open_name = None
+
+        if open_name is not None:
+            functions.append((open_name, open_start, n - 1))
+
         return functions
     
     def _find_basic_block_starts(self, lines: List[str]) -> Set[int]:
         """Find all line numbers that start basic blocks in objdump format"""
         starts = set()
-        
+        match = _LINE_RE.match
+        terminator_get = self._terminator_get
+        prev_terminates = False
+
         for i, line in enumerate(lines):
-            # Function headers start blocks
-            if self.function_header_pattern.match(line):
+            # Any line following a terminator starts a new block
+            if prev_terminates:
                 starts.add(i)
+            m = match(line)
+            if m is None:
+                prev_terminates = False
                 continue
-            
-            # Label headers start blocks  
-            if self.label_header_pattern.match(line):
+            opcode = m.group('opcode')
+            if opcode is None:
+                # Function and label headers start blocks
                 starts.add(i)
-                continue
-            
-            # Instructions after terminators start new blocks
-            if i > 0:
-                prev_line = lines[i-1]
-                if self._is_terminator_instruction_objdump(prev_line):
-                    starts.add(i)
-        
+                prev_terminates = False
+            else:
+                prev_terminates = terminator_get(opcode.lower()) is not None
+
         return starts
-    
-    def _is_terminator_instruction_objdump(self, line: str) -> bool:
-        """Check if objdump line contains a terminator instruction"""
-        inst_match = self.instruction_pattern.match(line)
-        if inst_match:
-            opcode = inst_match.group(2).lower()
-            return self._is_terminator_opcode(opcode)
-        return False
-    
+
     def _get_block_label(self, lines: List[str], start_idx: int) -> Optional[str]:
         """Extract label from objdump block start"""
         if start_idx < len(lines):
-            line = lines[start_idx]
-            
-            # Function header
-            func_match = self.function_header_pattern.match(line)
-            if func_match:
-                return func_match.group(2)
-            
-            # Label header
-            label_match = self.label_header_pattern.match(line)
-            if label_match:
-                return label_match.group(2)
-            
-            # Instruction line - create synthetic label
-            inst_match = self.instruction_pattern.match(line)
-            if inst_match:
-                address = inst_match.group(1)
-                return f"addr_{address}"
-        
+            m = _LINE_RE.match(lines[start_idx])
+            if m:
+                # Function header, label header, or synthetic label from
+                # the instruction address
+                name = m.group('func') or m.group('label')
+                if name:
+                    return name
+                return f"addr_{m.group('iaddr')}"
+
         return None
-    
+
     def _parse_instruction(self, line: str, line_number: int) -> Optional[Instruction]:
         """Parse a single objdump instruction"""
-        # Skip headers and empty lines
-        if (self.function_header_pattern.match(line) or 
-            self.label_header_pattern.match(line) or
-            not line.strip()):
+        # Headers, empty lines and other non-instruction lines parse to None
+        inst_match = _LINE_RE.match(line)
+        if not inst_match or inst_match.group('opcode') is None:
             return None
-        
-        # Parse instruction
-        inst_match = self.instruction_pattern.match(line)
-        if not inst_match:
-            return None
-        
-        address = inst_match.group(1)
-        opcode = inst_match.group(2).lower()
-        operands = inst_match.group(3).strip() if inst_match.group(3) else ""
+
+        opcode = sys.intern(inst_match.group('opcode').lower())
+        operands = inst_match.group('operands').strip()
         
         # Normalize operands using syntax parser
         normalized_operands = self._parse_operands(operands)
         
-        # Determine if this is a terminator
-        is_terminator = self._is_terminator_opcode(opcode)
-        terminator_type = self._get_terminator_type(opcode)
+        # Determine if this is a terminator: one dict probe yields both the
+        # predicate and the type
+        terminator_type = self._terminator_get(opcode)
+        is_terminator = terminator_type is not None
         jump_targets = self._extract_jump_targets(operands) if is_terminator else []
         
         return Instruction(
@@ -4,13 +4,36 @@ Assembly Parser Factory
 Factory for creating the appropriate assembly parser based on syntax and file type.
 """
 
-import re
 from enum import Enum
 from typing import Union
 from .base_parser import BaseAssemblyParser
 from .intel_parser import IntelAssemblyParser
 from .att_parser import ATTAssemblyParser
 
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+
+
+def _has_instruction_line(content: str) -> bool:
+    """Check for an objdump-style "addr: opcode" line with string scans
+
+    Equivalent to searching for r'[0-9a-fA-F]+:\\s+[a-zA-Z]' but walks
+    colon positions with str.find instead of running the regex engine
+    over the whole content.
+    """
+    n = len(content)
+    pos = content.find(':')
+    while pos != -1:
+        if pos > 0 and content[pos - 1] in _HEX_DIGITS:
+            j = pos + 1
+            while j < n and content[j] in ' \t\r\n\x0b\f':
+                j += 1
+            if j > pos + 1 and j < n:
+                c = content[j]
+                if 'a' <= c <= 'z' or 'A' <= c <= 'Z':
+                    return True
+        pos = content.find(':', pos + 1)
+    return False
+
 
 class AssemblySyntax(Enum):
     """Supported assembly syntaxes"""
@@ -24,60 +47,86 @@ class FileType(Enum):
     OBJDUMP = "objdump"
 
 
+# Fast-path normalization for the common lowercase string arguments; the
+# enum coercion below stays as the fallback for mixed-case input and for
+# producing the error message on unsupported values
+_SYNTAX_MAP = {'intel': AssemblySyntax.INTEL, 'att': AssemblySyntax.ATT}
+_FILE_TYPE_MAP = {'assembly': FileType.ASSEMBLY, 'objdump': FileType.OBJDUMP}
+
+
 class AssemblyParserFactory:
     """Factory for creating assembly parsers"""
-    
+
+    # Shared assembly parser instances, one per syntax. The assembly
+    # parsers keep no per-file state, so repeated factory calls can hand
+    # out the same instance instead of reconstructing pattern tables.
+    # Objdump parsers are never cached: they accumulate address/label
+    # mappings for the file they parse.
+    _syntax_parser_cache = {}
+
     @staticmethod
-    def create_parser(syntax: Union[AssemblySyntax, str] = AssemblySyntax.INTEL, 
+    def _get_syntax_parser(syntax: AssemblySyntax) -> BaseAssemblyParser:
+        """Get (or lazily create) the shared parser for a syntax"""
+        parser = AssemblyParserFactory._syntax_parser_cache.get(syntax)
+        if parser is None:
+            if syntax == AssemblySyntax.INTEL:
+                parser = IntelAssemblyParser()
+            elif syntax == AssemblySyntax.ATT:
+                parser = ATTAssemblyParser()
+            else:
+                raise ValueError(f"Unsupported assembly syntax: {syntax}")
+            AssemblyParserFactory._syntax_parser_cache[syntax] = parser
+        return parser
+
+    @staticmethod
+    def create_parser(syntax: Union[AssemblySyntax, str] = AssemblySyntax.INTEL,
                      file_type: Union[FileType, str] = FileType.ASSEMBLY) -> BaseAssemblyParser:
         """
         Create an assembly parser for the specified syntax and file type.
-        
+
+        Assembly parsers are shared across calls (they hold no per-file
+        state); objdump parsers are constructed fresh per call.
+
         Args:
             syntax: The assembly syntax (Intel or AT&T). Defaults to Intel.
             file_type: The file type (assembly or objdump). Defaults to assembly.
-            
+
         Returns:
             BaseAssemblyParser: The appropriate parser instance
-            
+
         Raises:
             ValueError: If the syntax or file type is not supported
         """
         if isinstance(syntax, str):
-            try:
-                syntax = AssemblySyntax(syntax.lower())
-            except ValueError:
-                raise ValueError(f"Unsupported assembly syntax: {syntax}. "
-                               f"Supported syntaxes: {[s.value for s in AssemblySyntax]}")
-        
+            mapped = _SYNTAX_MAP.get(syntax)
+            if mapped is None:
+                try:
+                    mapped = AssemblySyntax(syntax.lower())
+                except ValueError:
+                    raise ValueError(f"Unsupported assembly syntax: {syntax}. "
+                                   f"Supported syntaxes: {[s.value for s in AssemblySyntax]}")
+            syntax = mapped
+
         if isinstance(file_type, str):
-            try:
-                file_type = FileType(file_type.lower())
-            except ValueError:
-                raise ValueError(f"Unsupported file type: {file_type}. "
-                               f"Supported types: {[t.value for t in FileType]}")
+            mapped = _FILE_TYPE_MAP.get(file_type)
+            if mapped is None:
+                try:
+                    mapped = FileType(file_type.lower())
+                except ValueError:
+                    raise ValueError(f"Unsupported file type: {file_type}. "
+                                   f"Supported types: {[t.value for t in FileType]}")
+            file_type = mapped
         
         if file_type == FileType.OBJDUMP:
             from .objdump_parser import ObjdumpParser
-            
-            # Create syntax-specific parser for objdump to delegate to
-            if syntax == AssemblySyntax.INTEL:
-                syntax_parser = IntelAssemblyParser()
-            elif syntax == AssemblySyntax.ATT:
-                syntax_parser = ATTAssemblyParser()
-            else:
-                raise ValueError(f"Unsupported assembly syntax: {syntax}")
-            
-            return ObjdumpParser(syntax_parser)
-        
+
+            # Syntax-specific parser for objdump to delegate to; the
+            # delegate is only read, so the shared instance is safe
+            return ObjdumpParser(AssemblyParserFactory._get_syntax_parser(syntax))
+
         elif file_type == FileType.ASSEMBLY:
-            if syntax == AssemblySyntax.INTEL:
-                return IntelAssemblyParser()
-            elif syntax == AssemblySyntax.ATT:
-                return ATTAssemblyParser()
-            else:
-                raise ValueError(f"Unsupported assembly syntax: {syntax}")
-        
+            return AssemblyParserFactory._get_syntax_parser(syntax)
+
         else:
             raise ValueError(f"Unsupported file type: {file_type}")
     
@@ -95,90 +144,121 @@ class AssemblyParserFactory:
     def detect_syntax(file_path: str) -> AssemblySyntax:
         """
         Attempt to auto-detect assembly syntax from file content.
-        
+
         Args:
             file_path: Path to the assembly file
-            
+
         Returns:
             AssemblySyntax: The detected syntax (defaults to Intel if uncertain)
         """
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            # Simple heuristics for syntax detection
-            att_indicators = 0
-            intel_indicators = 0
-            
-            lines = content.split('\n')[:100]  # Check first 100 lines
-            
-            for line in lines:
-                line = line.strip().lower()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#') or line.startswith('.'):
-                    continue
-                
-                # AT&T syntax indicators
-                if '%' in line and ('movl' in line or 'movq' in line):  # AT&T register syntax
-                    att_indicators += 2
-                if '$' in line and ('mov' in line or 'cmp' in line):  # AT&T immediate syntax
-                    att_indicators += 1
-                if line.endswith('q') or line.endswith('l'):  # AT&T suffix
-                    att_indicators += 1
-                
-                # Intel syntax indicators  
-                if 'mov ' in line and not '%' in line:  # Intel mov without % registers
-                    intel_indicators += 1
-                if ('eax' in line or 'rax' in line) and not '%' in line:  # Intel register syntax
-                    intel_indicators += 1
-            
-            # Return detected syntax
-            if att_indicators > intel_indicators:
-                return AssemblySyntax.ATT
-            else:
-                return AssemblySyntax.INTEL
-                
         except Exception:
             # Default to Intel if detection fails
             return AssemblySyntax.INTEL
-    
+
+        return AssemblyParserFactory.detect_syntax_from_content(content)
+
+    @staticmethod
+    def detect_syntax_from_content(content: str) -> AssemblySyntax:
+        """
+        Auto-detect assembly syntax from already-loaded file content.
+
+        Allows callers that read the file once (e.g. the CLI auto-detect path)
+        to run both syntax and file type detection without re-reading it.
+
+        Args:
+            content: File content (or a large enough head of it)
+
+        Returns:
+            AssemblySyntax: The detected syntax (defaults to Intel if uncertain)
+        """
+        # Simple heuristics for syntax detection
+        att_indicators = 0
+        intel_indicators = 0
+
+        lines = content.split('\n')[:100]  # Check first 100 lines
+
+        for line in lines:
+            line = line.strip().lower()
+
+            # Skip comments and empty lines
+            if not line or line.startswith('#') or line.startswith('.'):
+                continue
+
+            # AT&T syntax indicators
+            if '%' in line and ('movl' in line or 'movq' in line):  # AT&T register syntax
+                att_indicators += 2
+            if '$' in line and ('mov' in line or 'cmp' in line):  # AT&T immediate syntax
+                att_indicators += 1
+            if line.endswith('q') or line.endswith('l'):  # AT&T suffix
+                att_indicators += 1
+
+            # Intel syntax indicators
+            if 'mov ' in line and not '%' in line:  # Intel mov without % registers
+                intel_indicators += 1
+            if ('eax' in line or 'rax' in line) and not '%' in line:  # Intel register syntax
+                intel_indicators += 1
+
+        # Return detected syntax
+        if att_indicators > intel_indicators:
+            return AssemblySyntax.ATT
+        else:
+            return AssemblySyntax.INTEL
+
     @staticmethod
     def detect_file_type(file_path: str) -> FileType:
         """
         Attempt to auto-detect file type from file extension and content.
-        
+
         Args:
             file_path: Path to the file
-            
+
         Returns:
             FileType: The detected file type (defaults to assembly if uncertain)
         """
-        from pathlib import Path
         from .objdump_parser import ObjdumpParser
-        
-        file_path_obj = Path(file_path)
-        
+
         try:
             # Check if it's an object file by extension first
             if ObjdumpParser.is_object_file(file_path):
                 return FileType.OBJDUMP
-            
+
             # Check file content for objdump format
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-            
-            # Check for objdump indicators
-            if ('file format' in content and 
-                'Disassembly of section' in content and
-                re.search(r'[0-9a-fA-F]+:\s+[a-zA-Z]', content)):
-                return FileType.OBJDUMP
-            else:
-                return FileType.ASSEMBLY
-                
         except Exception:
             return FileType.ASSEMBLY
 
+        return AssemblyParserFactory.detect_file_type_from_content(file_path, content)
+
+    @staticmethod
+    def detect_file_type_from_content(file_path: str, content: str) -> FileType:
+        """
+        Auto-detect file type from already-loaded file content.
+
+        Args:
+            file_path: Path to the file (used for the extension check)
+            content: File content (or a large enough head of it)
+
+        Returns:
+            FileType: The detected file type (defaults to assembly if uncertain)
+        """
+        from .objdump_parser import ObjdumpParser
+
+        # Check if it's an object file by extension first
+        if ObjdumpParser.is_object_file(file_path):
+            return FileType.OBJDUMP
+
+        # Check for objdump indicators
+        if ('file format' in content and
+            'Disassembly of section' in content and
+            _has_instruction_line(content)):
+            return FileType.OBJDUMP
+        else:
+            return FileType.ASSEMBLY
+
 
 # Convenience function for backward compatibility
 def create_cfg_parser(syntax: Union[AssemblySyntax, str] = AssemblySyntax.INTEL) -> BaseAssemblyParser:
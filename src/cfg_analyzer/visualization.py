@@ -111,39 +111,83 @@ def export_cfg_to_dot(cfg: ControlFlowGraph, output_file: str, include_instructi
     """Export CFG to DOT format for visualization"""
     # Detect back edges for loop coloring
     back_edges = cfg.detect_back_edges()
-    
-    with open(output_file, 'w') as f:
-        f.write(f'digraph "{cfg.function_name}" {{\n')
-        f.write('  rankdir=TB;\n')
-        f.write('  node [shape=box, fontname="Consolas", fontsize=10, margin=0.1, labeljust=l];\n')
-        f.write('  edge [fontname="Arial", fontsize=9];\n')
-        f.write('  graph [bgcolor=white, splines=true, nodesep=0.3, ranksep=0.5];\n\n')
-        
-        # Write nodes
-        for label, block in cfg.basic_blocks.items():
-            if include_instructions:
-                node_label = _create_detailed_node_label(label, block, max_instructions)
+
+    # Accumulate the whole document and flush it with a single write call
+    # instead of one small write per node/edge
+    parts = [
+        f'digraph "{cfg.function_name}" {{\n',
+        '  rankdir=TB;\n',
+        '  node [shape=box, fontname="Consolas", fontsize=10, margin=0.1, labeljust=l];\n',
+        '  edge [fontname="Arial", fontsize=9];\n',
+        '  graph [bgcolor=white, splines=true, nodesep=0.3, ranksep=0.5];\n\n',
+    ]
+
+    # Write nodes
+    for label, block in cfg.basic_blocks.items():
+        if include_instructions:
+            node_label = _create_detailed_node_label(label, block, max_instructions)
+        else:
+            node_label = _create_summary_node_label(label, block)
+
+        # Enhanced styling based on block type
+        style_attrs = _get_node_style(block)
+        parts.append(f'  "{label}" [label="{node_label}", {style_attrs}];\n')
+
+    parts.append('\n')
+
+    # Write edges with loop edge coloring
+    for label, block in cfg.basic_blocks.items():
+        for successor in block.successors:
+            # Check if this is a back edge (loop edge)
+            if (label, successor) in back_edges:
+                # Color back edges red to indicate loops
+                parts.append(f'  "{label}" -> "{successor}" [color=red, penwidth=2.5, style=bold, arrowhead=vee];\n')
             else:
-                node_label = _create_summary_node_label(label, block)
-            
-            # Enhanced styling based on block type
-            style_attrs = _get_node_style(block)
-            f.write(f'  "{label}" [label="{node_label}", {style_attrs}];\n')
-        
-        f.write('\n')
-        
-        # Write edges with loop edge coloring
-        for label, block in cfg.basic_blocks.items():
-            for successor in block.successors:
-                # Check if this is a back edge (loop edge)
-                if (label, successor) in back_edges:
-                    # Color back edges red to indicate loops
-                    f.write(f'  "{label}" -> "{successor}" [color=red, penwidth=2.5, style=bold, arrowhead=vee];\n')
-                else:
-                    # Regular edges
-                    f.write(f'  "{label}" -> "{successor}" [color=black, penwidth=1.2, arrowhead=normal];\n')
-        
-        f.write('}\n')
+                # Regular edges
+                parts.append(f'  "{label}" -> "{successor}" [color=black, penwidth=1.2, arrowhead=normal];\n')
+
+    parts.append('}\n')
+
+    with open(output_file, 'w') as f:
+        f.write(''.join(parts))
+
+
+def cfg_to_dict(cfg: ControlFlowGraph) -> dict:
+    """Convert a CFG to a JSON-serializable dict
+
+    Blocks are emitted column-wise (parallel lists plus a CSR-style
+    successor encoding) rather than as one dict per block, which keeps the
+    payload compact and cheap to serialize for large functions.
+    """
+    labels = list(cfg.basic_blocks.keys())
+    index = {label: i for i, label in enumerate(labels)}
+
+    start_lines = []
+    end_lines = []
+    instruction_counts = []
+    succ_indptr = [0]
+    succ_indices = []
+
+    for label in labels:
+        block = cfg.basic_blocks[label]
+        start_lines.append(block.start_line)
+        end_lines.append(block.end_line)
+        instruction_counts.append(len(block.instructions))
+        succ_indices.extend(sorted(index[s] for s in block.successors if s in index))
+        succ_indptr.append(len(succ_indices))
+
+    return {
+        "function": cfg.function_name,
+        "entry": cfg.entry_block,
+        "blocks": {
+            "labels": labels,
+            "start_lines": start_lines,
+            "end_lines": end_lines,
+            "instruction_counts": instruction_counts,
+            "succ_indptr": succ_indptr,
+            "succ_indices": succ_indices,
+        },
+    }
 
 
 def _get_node_style(block: BasicBlock) -> str:
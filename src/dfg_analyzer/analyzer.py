@@ -4,7 +4,7 @@ Data flow analysis for assembly instructions
 Analyzes data dependencies between instructions in assembly basic blocks.
 """
 
-import re
+import io
 from typing import List, Set, Tuple, Optional
 from .models import Instruction, DataDependency
 from .generic_parser import GenericAssemblyParser
@@ -24,11 +24,38 @@ class DataFlowAnalyzer:
         """
         self.parser = GenericAssemblyParser(architecture)
         self.config: Optional[ArchitectureConfig] = None
-        
+        self._addr_calc_opcodes = frozenset()
+        self._opcode_class = {}
+
     def _ensure_config(self, assembly_text: str = ""):
         """Ensure architecture configuration is loaded"""
         self.parser._ensure_config(assembly_text)
-        self.config = self.parser.config
+        if self.config is not self.parser.config:
+            self.config = self.parser.config
+            # LEA-like opcodes that only calculate addresses; derived once
+            # per config instead of per analyzed instruction
+            self._addr_calc_opcodes = frozenset(
+                name for name, info in self.config.special_instructions.items()
+                if info.get("behavior") == "address_calculation_only")
+            # Single dispatch table replacing the chain of category set
+            # lookups plus the per-call mask-prefix scan: opcode -> class
+            # (1=read-write, 2=read-only, 3=jump, 4=mask read-write,
+            #  5=address calculation; 0/absent=unclassified).
+            # Later assignments win, mirroring the old branch precedence.
+            config = self.config
+            opcode_class = {}
+            for op in config.jump_instructions:
+                opcode_class[op] = 3
+            for op in config.read_only_instructions:
+                opcode_class[op] = 2
+            for op in config.read_write_instructions:
+                if any(op.startswith(p) for p in config.mask_instructions):
+                    opcode_class[op] = 4
+                else:
+                    opcode_class[op] = 1
+            for op in self._addr_calc_opcodes:
+                opcode_class[op] = 5
+            self._opcode_class = opcode_class
     
     def analyze_instruction_operands(self, instruction: Instruction) -> Tuple[Set[str], Set[str], Set[str]]:
         """
@@ -40,23 +67,25 @@ class DataFlowAnalyzer:
             memory_ops: Set of memory operations
         """
         self._ensure_config()
-        
+
+        # Analysis only depends on the operands, so pay the parse cost once
+        # per instruction no matter how often it is re-analyzed
+        if instruction._cached_rwm is not None:
+            return instruction._cached_rwm
+
         reads = set()
         writes = set()
         memory_ops = set()
-        
+
         if not instruction.operands:
+            instruction._cached_rwm = (reads, writes, memory_ops)
             return reads, writes, memory_ops
-        
+
         opcode = instruction.opcode.lower()
-        
+        opcode_class = self._opcode_class.get(opcode, 0)
+
         # Special case for LEA-like instructions (address calculation only)
-        special_addr_calc_instructions = set()
-        for name, info in self.config.special_instructions.items():
-            if info.get("behavior") == "address_calculation_only":
-                special_addr_calc_instructions.add(name)
-        
-        if opcode in special_addr_calc_instructions:
+        if opcode_class == 5:
             # These instructions don't access memory, only calculate addresses
             if len(instruction.operands) >= 2:
                 dest_reads, _, _ = self.parser.parse_operand(instruction.operands[0])
@@ -64,105 +93,99 @@ class DataFlowAnalyzer:
                 
                 # Extract only the registers from the memory expression
                 src_operand = instruction.operands[1]
-                if '[' in src_operand and ']' in src_operand:
-                    # Extract register names from memory expression without treating as memory access
-                    memory_expr = re.search(r'\[([^\]]+)\]', src_operand)
-                    if memory_expr:
-                        expr_content = memory_expr.group(1)
-                        # Find register names in the expression
-                        reg_pattern = self.config.memory_patterns["register"]
-                        reg_matches = re.findall(reg_pattern, expr_content, re.IGNORECASE)
-                        for reg in reg_matches:
-                            reads.add(self.parser.normalize_register(reg))
+                lb = src_operand.find('[')
+                rb = src_operand.find(']', lb + 1) if lb != -1 else -1
+                if rb > lb + 1:
+                    # Register names from the memory expression without
+                    # treating it as a memory access
+                    parser = self.parser
+                    for tok in parser._tok_re.findall(src_operand[lb + 1:rb]):
+                        low = tok.lower()
+                        if low in parser._registers:
+                            reads.add(parser._norm.get(low, low))
                 else:
                     # Handle non-memory source operands
                     src_reads, _, _ = self.parser.parse_operand(src_operand)
                     reads.update(src_reads)
         
-        # Handle different instruction types using configuration
-        elif opcode in self.config.read_write_instructions:
-            # Special handling for mask instructions
-            is_mask_instruction = any(opcode.startswith(pattern) for pattern in self.config.mask_instructions)
-            
-            if is_mask_instruction:
-                # Mask-generating/manipulating instructions: first operand is destination (write-only), rest are sources
-                if instruction.operands:
-                    # Destination operand (write-only)
-                    dest_reads, dest_writes, dest_mem = self.parser.parse_operand(instruction.operands[0])
+        # Handle different instruction types using the precomputed table
+        elif opcode_class == 4:
+            # Mask-generating/manipulating instructions: first operand is destination (write-only), rest are sources
+            if instruction.operands:
+                # Destination operand (write-only)
+                dest_reads, dest_writes, dest_mem = self.parser.parse_operand(instruction.operands[0])
                     
-                    if dest_mem:
-                        memory_ops.add(dest_mem)
-                        reads.update(dest_reads)  # Memory address calculation
-                        writes.add(dest_mem)      # Memory write
-                    else:
-                        # For destination operands, separate main register writes from mask register reads
-                        dest_operand = instruction.operands[0]
+                if dest_mem:
+                    memory_ops.add(dest_mem)
+                    reads.update(dest_reads)  # Memory address calculation
+                    writes.add(dest_mem)      # Memory write
+                else:
+                    # For destination operands, separate main register writes from mask register reads
+                    dest_operand = instruction.operands[0]
                         
-                        # Extract mask registers (these are reads even in destination operands)
-                        if "mask_register" in self.config.memory_patterns:
-                            mask_pattern = self.config.memory_patterns["mask_register"]
-                            mask_matches = re.findall(mask_pattern, dest_operand, re.IGNORECASE)
-                            for mask in mask_matches:
-                                reads.add(self.parser.normalize_register(mask))
+                    # Extract mask registers (these are reads even in destination operands)
+                    if self.parser._mask_re is not None:
+                        mask_matches = self.parser._mask_re.findall(dest_operand)
+                        for mask in mask_matches:
+                            reads.add(self.parser.normalize_register(mask))
                         
-                        # Extract main registers (these are writes for destination)
-                        # Remove mask syntax to get the main register
-                        clean_operand = re.sub(r'\{[^}]+\}', '', dest_operand)
-                        main_reads, main_writes, main_mem = self.parser.parse_operand(clean_operand)
-                        writes.update(main_reads)  # Main register is written to
+                    # Extract main registers (these are writes for destination)
+                    # Remove mask syntax to get the main register
+                    clean_operand = self.parser._mask_strip_re.sub('', dest_operand)
+                    main_reads, main_writes, main_mem = self.parser.parse_operand(clean_operand)
+                    writes.update(main_reads)  # Main register is written to
                     
-                    # Source operands (read-only)
-                    for operand in instruction.operands[1:]:
-                        src_reads, src_writes, src_mem = self.parser.parse_operand(operand)
-                        reads.update(src_reads)
-                        if src_mem:
-                            memory_ops.add(src_mem)
-                            reads.add(src_mem)
-            else:
-                # Regular read-write instructions
-                # First operand is usually destination (write), rest are source (read)
-                if instruction.operands:
-                    # Destination operand
-                    dest_reads, dest_writes, dest_mem = self.parser.parse_operand(instruction.operands[0])
+                # Source operands (read-only)
+                for operand in instruction.operands[1:]:
+                    src_reads, src_writes, src_mem = self.parser.parse_operand(operand)
+                    reads.update(src_reads)
+                    if src_mem:
+                        memory_ops.add(src_mem)
+                        reads.add(src_mem)
+        elif opcode_class == 1:
+            # Regular read-write instructions
+            # First operand is usually destination (write), rest are source (read)
+            if instruction.operands:
+                # Destination operand
+                dest_reads, dest_writes, dest_mem = self.parser.parse_operand(instruction.operands[0])
                     
-                    if dest_mem:
-                        memory_ops.add(dest_mem)
-                        reads.update(dest_reads)  # Memory address calculation
-                        writes.add(dest_mem)      # Memory write
-                    else:
-                        # For destination operands, separate main register writes from mask register reads
-                        dest_operand = instruction.operands[0]
+                if dest_mem:
+                    memory_ops.add(dest_mem)
+                    reads.update(dest_reads)  # Memory address calculation
+                    writes.add(dest_mem)      # Memory write
+                else:
+                    # For destination operands, separate main register writes from mask register reads
+                    dest_operand = instruction.operands[0]
                         
-                        # Extract mask registers (these are reads even in destination operands)
-                        if "mask_register" in self.config.memory_patterns:
-                            mask_pattern = self.config.memory_patterns["mask_register"]
-                            mask_matches = re.findall(mask_pattern, dest_operand, re.IGNORECASE)
-                            for mask in mask_matches:
-                                reads.add(self.parser.normalize_register(mask))
+                    # Extract mask registers (these are reads even in destination operands)
+                    if self.parser._mask_re is not None:
+                        mask_matches = self.parser._mask_re.findall(dest_operand)
+                        for mask in mask_matches:
+                            reads.add(self.parser.normalize_register(mask))
                         
-                        # Extract main registers (these are writes for destination)
-                        # Remove mask syntax to get the main register
-                        clean_operand = re.sub(r'\{[^}]+\}', '', dest_operand)
-                        main_reads, main_writes, main_mem = self.parser.parse_operand(clean_operand)
-                        writes.update(main_reads)  # Main register is written to
+                    # Extract main registers (these are writes for destination)
+                    # Remove mask syntax to get the main register
+                    clean_operand = self.parser._mask_strip_re.sub('', dest_operand)
+                    main_reads, main_writes, main_mem = self.parser.parse_operand(clean_operand)
+                    writes.update(main_reads)  # Main register is written to
                     
-                    # Source operands
-                    for operand in instruction.operands[1:]:
-                        src_reads, src_writes, src_mem = self.parser.parse_operand(operand)
-                        reads.update(src_reads)
-                        if src_mem:
-                            memory_ops.add(src_mem)
-                            reads.add(src_mem)
+                # Source operands
+                for operand in instruction.operands[1:]:
+                    src_reads, src_writes, src_mem = self.parser.parse_operand(operand)
+                    reads.update(src_reads)
+                    if src_mem:
+                        memory_ops.add(src_mem)
+                        reads.add(src_mem)
                     
-                    # Handle read-modify-write instructions (destination is also read)
-                    if opcode in self.config.read_modify_write_instructions:
-                        # Destination is also read in these instructions
-                        if dest_mem:
-                            reads.add(dest_mem)  # Memory location is read before being written
-                        else:
-                            reads.update(dest_reads)  # Register is read before being written
+                # Handle read-modify-write instructions (destination is also read)
+                if opcode in self.config.read_modify_write_instructions:
+                    # Destination is also read in these instructions
+                    if dest_mem:
+                        reads.add(dest_mem)  # Memory location is read before being written
+                    else:
+                        reads.update(dest_reads)  # Register is read before being written
         
-        elif opcode in self.config.read_only_instructions:
+        elif opcode_class == 2:
             # All operands are read
             for operand in instruction.operands:
                 op_reads, op_writes, op_mem = self.parser.parse_operand(operand)
@@ -171,89 +194,114 @@ class DataFlowAnalyzer:
                     memory_ops.add(op_mem)
                     reads.add(op_mem)
         
-        elif opcode in self.config.jump_instructions:
+        elif opcode_class == 3:
             # Jump instructions typically read their operands
             for operand in instruction.operands:
                 op_reads, op_writes, op_mem = self.parser.parse_operand(operand)
                 reads.update(op_reads)
-        
+
+        instruction._cached_rwm = (reads, writes, memory_ops)
         return reads, writes, memory_ops
     
     def find_dependencies(self, instructions: List[Instruction]) -> List[DataDependency]:
         """Find data dependencies between instructions"""
         self._ensure_config()
-        
+
         dependencies = []
-        
-        # Track last writer for each resource
-        last_writer = {}  # resource -> instruction_index
-        
-        def classify_operand_type(resource: str) -> str:
-            """Classify if a resource is a register or memory operand"""
-            # Check if resource contains memory bracket notation
-            if '[' in resource and ']' in resource:
-                return 'memory'
-            else:
-                return 'register'
-        
-        for i, instruction in enumerate(instructions):
-            reads, writes, memory_ops = self.analyze_instruction_operands(instruction)
-            
+
+        # Analyze each instruction exactly once - the WAR search below used to
+        # re-run the whole operand pipeline for every earlier instruction.
+        # The scan below walks this flat list only; Instruction objects (and
+        # their scattered operand lists) stay out of the hot loop entirely.
+        analyzed = [self.analyze_instruction_operands(ins) for ins in instructions]
+
+        # Single fused pass over dense integer resource ids: each resource
+        # (register or memory token) gets an id on first sight, after which
+        # the scan indexes flat lists - no string hashing in the hot loop
+        # and the register/memory classification is done once per resource
+        ids = {}             # resource name -> dense id
+        names = []           # id -> resource name
+        operand_types = []   # id -> 'register' or 'memory'
+        last_writer = []     # id -> last writing instruction index, -1 if none
+        recent_readers = []  # id -> readers since that resource's last write
+
+        def resource_id(resource: str) -> int:
+            r = ids.get(resource)
+            if r is None:
+                r = len(names)
+                ids[resource] = r
+                names.append(resource)
+                operand_types.append(
+                    'memory' if '[' in resource and ']' in resource else 'register')
+                last_writer.append(-1)
+                recent_readers.append([])
+            return r
+
+        for i, (reads, writes, memory_ops) in enumerate(analyzed):
+            # Instructions that touch no tracked resource (bare jumps, nops)
+            # contribute nothing - skip their bookkeeping outright
+            if not reads and not writes:
+                continue
+
             # Check for Read-After-Write (RAW) dependencies
             for resource in reads:
-                if resource in last_writer:
+                r = resource_id(resource)
+                if last_writer[r] != -1:
                     dep = DataDependency(
-                        source_line=last_writer[resource],
+                        source_line=last_writer[r],
                         target_line=i,
-                        resource=resource,
+                        resource=names[r],
                         dependency_type='RAW',
-                        operand_type=classify_operand_type(resource)
+                        operand_type=operand_types[r]
                     )
                     dependencies.append(dep)
-            
+                recent_readers[r].append(i)
+
             # Check for Write-After-Read (WAR) and Write-After-Write (WAW)
             for resource in writes:
-                # Find all previous instructions that read this resource (WAR)
-                for j in range(i):
-                    prev_reads, prev_writes, prev_memory = self.analyze_instruction_operands(instructions[j])
-                    if resource in prev_reads and j > last_writer.get(resource, -1):
+                r = resource_id(resource)
+                # Readers since the last write form WAR dependencies
+                for j in recent_readers[r]:
+                    if j != i:
                         dep = DataDependency(
                             source_line=j,
                             target_line=i,
-                            resource=resource,
+                            resource=names[r],
                             dependency_type='WAR',
-                            operand_type=classify_operand_type(resource)
+                            operand_type=operand_types[r]
                         )
                         dependencies.append(dep)
-                
+
                 # Check for WAW
-                if resource in last_writer:
+                if last_writer[r] != -1:
                     dep = DataDependency(
-                        source_line=last_writer[resource],
+                        source_line=last_writer[r],
                         target_line=i,
-                        resource=resource,
+                        resource=names[r],
                         dependency_type='WAW',
-                        operand_type=classify_operand_type(resource)
+                        operand_type=operand_types[r]
                     )
                     dependencies.append(dep)
-                
-                # Update last writer
-                last_writer[resource] = i
-        
+
+                # This write starts a new reader epoch for the resource
+                recent_readers[r] = []
+                last_writer[r] = i
+
         return dependencies
     
     def parse_basic_block(self, assembly_text: str) -> List[Instruction]:
         """Parse assembly text into instructions"""
         self._ensure_config(assembly_text)
-        
+
         instructions = []
-        lines = assembly_text.strip().split('\n')
-        
-        for i, line in enumerate(lines):
+        # Stream line by line rather than materializing a full line list;
+        # stripping first keeps line numbering anchored at the first
+        # non-blank line, as before
+        for i, line in enumerate(io.StringIO(assembly_text.strip())):
             instruction = self.parser.parse_instruction(line, i)
             if instruction and instruction.opcode:  # Skip empty lines and label-only lines
                 instructions.append(instruction)
-        
+
         return instructions
     
     def get_architecture_info(self) -> dict:
@@ -7,6 +7,7 @@ This allows the dataflow tool to support multiple architectures.
 
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass
@@ -102,13 +103,14 @@ class ArchitectureLoader:
         for base_reg, aliases in data["register_aliases"].items():
             register_aliases[base_reg] = set(aliases)
         
-        # Process instruction categories
+        # Process instruction categories. Opcodes are interned so membership
+        # tests against interned parsed opcodes hit pointer equality first.
         inst_categories = data["instruction_categories"]
-        read_write_instructions = set(inst_categories.get("read_write", []))
-        read_only_instructions = set(inst_categories.get("read_only", []))
-        jump_instructions = set(inst_categories.get("jump", []))
-        read_modify_write_instructions = set(inst_categories.get("read_modify_write", []))
-        mask_instructions = set(inst_categories.get("mask_instructions", []))
+        read_write_instructions = frozenset(map(sys.intern, inst_categories.get("read_write", [])))
+        read_only_instructions = frozenset(map(sys.intern, inst_categories.get("read_only", [])))
+        jump_instructions = frozenset(map(sys.intern, inst_categories.get("jump", [])))
+        read_modify_write_instructions = frozenset(map(sys.intern, inst_categories.get("read_modify_write", [])))
+        mask_instructions = frozenset(map(sys.intern, inst_categories.get("mask_instructions", [])))
         
         # Process special instructions
         special_instructions = data.get("special_instructions", {})
@@ -8,6 +8,12 @@ Simple ASCII visualization for data flow dependencies.
 import re
 from .models import LegacyInstruction, Dependency
 
+# x86-64 register tokens recognized by the ASCII visualizer; compiled once
+# instead of re-deriving the pattern for every finditer call
+_REG_RE = re.compile(
+    r'\b(?:rax|rbx|rcx|rdx|rsi|rdi|rsp|rbp|r8|r9|r10|r11|r12|r13|r14|r15|'
+    r'eax|ebx|ecx|edx|esi|edi|esp|ebp|xmm\d+|ymm\d+|zmm\d+)\b')
+
 class ASCIIDataFlowVisualizer:
     def __init__(self):
         self.instructions = []
@@ -34,8 +40,6 @@ class ASCIIDataFlowVisualizer:
                 self.instructions.append(instr)
     
     def _analyze_registers(self, instr):
-        reg_pattern = r'\b(?:rax|rbx|rcx|rdx|rsi|rdi|rsp|rbp|r8|r9|r10|r11|r12|r13|r14|r15|eax|ebx|ecx|edx|esi|edi|esp|ebp|xmm\d+|ymm\d+|zmm\d+)\b'
-        
         operands = instr.operands
         if not operands:
             return
@@ -52,11 +56,11 @@ class ASCIIDataFlowVisualizer:
                 bracket_end = operand.find(']')
                 if bracket_start != -1 and bracket_end != -1:
                     address_expr = operand[bracket_start+1:bracket_end]
-                    for match in re.finditer(reg_pattern, address_expr):
+                    for match in _REG_RE.finditer(address_expr):
                         instr.memory_address_reads.add(match.group())
                 return data_reads, data_writes
             else:
-                for match in re.finditer(reg_pattern, operand):
+                for match in _REG_RE.finditer(operand):
                     reg = match.group()
                     if is_destination:
                         data_writes.add(reg)
@@ -103,7 +107,7 @@ class ASCIIDataFlowVisualizer:
                     bracket_end = src.find(']')
                     if bracket_start != -1 and bracket_end != -1:
                         address_expr = src[bracket_start+1:bracket_end]
-                        for match in re.finditer(reg_pattern, address_expr):
+                        for match in _REG_RE.finditer(address_expr):
                             instr.memory_address_reads.add(match.group())
             
             elif instr.opcode.startswith(('movzx', 'movsx', 'movsxd')):
@@ -141,10 +145,10 @@ class ASCIIDataFlowVisualizer:
                     bracket_end = operand.find(']')
                     if bracket_start != -1 and bracket_end != -1:
                         address_expr = operand[bracket_start+1:bracket_end]
-                        for match in re.finditer(reg_pattern, address_expr):
+                        for match in _REG_RE.finditer(address_expr):
                             instr.memory_address_reads.add(match.group())
                 else:
-                    for match in re.finditer(reg_pattern, operand):
+                    for match in _REG_RE.finditer(operand):
                         reg = match.group()
                         instr.reads.add(reg)
                         instr.writes.add(reg)
@@ -154,18 +158,28 @@ class ASCIIDataFlowVisualizer:
     
     def find_dependencies(self):
         self.dependencies = []
-        
-        for i, instr1 in enumerate(self.instructions):
-            for j, instr2 in enumerate(self.instructions[i+1:], i+1):
-                for reg in instr1.writes:
-                    if reg in instr2.reads:
-                        self.dependencies.append(Dependency(i, j, reg, "RAW"))
-                for reg in instr1.writes:
-                    if reg in instr2.writes:
-                        self.dependencies.append(Dependency(i, j, reg, "WAW"))
-                for reg in instr1.reads:
-                    if reg in instr2.writes:
-                        self.dependencies.append(Dependency(i, j, reg, "WAR"))
+
+        # Single forward scan instead of the old instruction-pair cartesian
+        # product: track the last writer and the readers since that write per
+        # register, so each hazard is found against the relevant instruction
+        # rather than every later one
+        last_writer = {}
+        readers_since_write = {}
+
+        for j, instr in enumerate(self.instructions):
+            for reg in instr.reads:
+                writer = last_writer.get(reg)
+                if writer is not None:
+                    self.dependencies.append(Dependency(writer, j, reg, "RAW"))
+                readers_since_write.setdefault(reg, []).append(j)
+            for reg in instr.writes:
+                writer = last_writer.get(reg)
+                if writer is not None:
+                    self.dependencies.append(Dependency(writer, j, reg, "WAW"))
+                for reader in readers_since_write.pop(reg, ()):
+                    if reader != j:
+                        self.dependencies.append(Dependency(reader, j, reg, "WAR"))
+                last_writer[reg] = j
     
     def detect_loop_carried_dependencies(self):
         self.loop_carried_deps = []
@@ -252,14 +266,20 @@ class ASCIIDataFlowVisualizer:
         
         max_instr_len = max(len(instr.full_text) for instr in self.instructions) if self.instructions else 0
         instr_width = max(50, max_instr_len + 5)
-        
+
+        # Bucket dependencies by source line once; the old loop rescanned the
+        # whole dependency list for every written register of every line
+        deps_by_source = {}
+        for dep in self.dependencies:
+            deps_by_source.setdefault(dep.from_instr, []).append(dep)
+
         for i, instr in enumerate(self.instructions):
             immediate_deps = {}
-            for reg in instr.writes:
-                for dep in self.dependencies:
-                    if dep.from_instr == i and dep.register == reg:
-                        if reg not in immediate_deps or dep.to_instr < immediate_deps[reg][0]:
-                            immediate_deps[reg] = (dep.to_instr, dep.dep_type)
+            for dep in deps_by_source.get(i, ()):
+                reg = dep.register
+                if reg in instr.writes:
+                    if reg not in immediate_deps or dep.to_instr < immediate_deps[reg][0]:
+                        immediate_deps[reg] = (dep.to_instr, dep.dep_type)
             
             instr_text = f"L{i:2d}: {instr.full_text}"
             
@@ -6,10 +6,17 @@ by using architecture-specific configuration files.
 """
 
 import re
+import sys
 from typing import Dict, List, Set, Tuple, Optional
 from .models import Instruction
 from .arch_config import ArchitectureConfig, load_architecture, detect_architecture
 
+# Derived per-architecture tables (compiled regexes, alias map, register set,
+# operand cache), keyed by architecture name. The config itself is already
+# cached by ArchitectureLoader; caching the derived state too makes repeated
+# parser/analyzer construction effectively free.
+_derived_state = {}
+
 
 class GenericAssemblyParser:
     """Generic parser that works with multiple architectures via configuration"""
@@ -25,10 +32,11 @@ class GenericAssemblyParser:
         self.architecture_name = architecture
         self.config: Optional[ArchitectureConfig] = None
         self._auto_detect = architecture is None
-        
+
         if architecture:
             self.config = load_architecture(architecture)
-    
+            self._compile_patterns()
+
     def _ensure_config(self, assembly_text: str = ""):
         """Ensure configuration is loaded, auto-detecting if necessary"""
         if self.config is None:
@@ -43,20 +51,67 @@ class GenericAssemblyParser:
                     self.config = load_architecture("x86_64")
             else:
                 raise ValueError("No architecture configuration loaded")
-    
+            self._compile_patterns()
+
+    def _compile_patterns(self):
+        """Bind the architecture's derived operand tables to this parser
+
+        parse_operand runs for every operand of every instruction; compiling
+        here keeps re.compile (and the regex-cache lookups) out of that loop.
+        The derived state is built once per architecture and shared between
+        parser instances.
+        """
+        derived = _derived_state.get(self.architecture_name)
+        if derived is not None:
+            (self._memory_re, self._register_re, self._mask_re,
+             self._mask_strip_re, self._tok_re, self._registers,
+             self._norm, self._operand_cache, self._bracket_memory) = derived
+            return
+
+        patterns = self.config.memory_patterns
+        self._memory_re = re.compile(patterns["memory_operand"])
+        # For the common [expr] memory syntax, plain str.find beats running
+        # the regex engine; other syntaxes (RISC-V offset(reg)) keep the regex
+        self._bracket_memory = patterns["memory_operand"] == r'\[([^\]]+)\]'
+        self._register_re = re.compile(patterns["register"], re.IGNORECASE)
+        # Cheap tokenizer + set membership instead of the ~170-way register
+        # alternation: pull word-start identifiers and hash-check them.
+        # (?<!\w) mirrors the alternation's leading \b so "0x10" does not
+        # yield a bogus "x10" token.
+        self._tok_re = re.compile(r'(?<!\w)[a-zA-Z][a-zA-Z0-9]*')
+        self._registers = {r.lower() for r in self.config.all_registers}
+        # Operand strings repeat constantly across a file (same registers,
+        # same addressing expressions), so memoize parse_operand results.
+        # Callers only read or .update() from the returned sets.
+        self._operand_cache = {}
+        if "mask_register" in patterns:
+            self._mask_re = re.compile(patterns["mask_register"], re.IGNORECASE)
+        else:
+            self._mask_re = None
+        self._mask_strip_re = re.compile(r'\{[^}]+\}')
+
+        # Flat alias -> base map so normalize_register is a single dict lookup
+        # instead of a scan over every alias group per register token.
+        # Names are interned so later set lookups short-circuit on identity.
+        self._norm = {}
+        for base_reg, aliases in self.config.register_aliases.items():
+            base_reg = sys.intern(base_reg)
+            for alias in aliases:
+                self._norm[sys.intern(alias)] = base_reg
+        for reg in self._registers:
+            self._norm.setdefault(sys.intern(reg), sys.intern(reg))
+
+        _derived_state[self.architecture_name] = (
+            self._memory_re, self._register_re, self._mask_re,
+            self._mask_strip_re, self._tok_re, self._registers,
+            self._norm, self._operand_cache, self._bracket_memory)
+
     def normalize_register(self, reg: str) -> str:
         """Normalize register name to its base form"""
         self._ensure_config()
-        
+
         reg = reg.lower()
-        
-        # Find the base register for this alias
-        for base_reg, aliases in self.config.register_aliases.items():
-            if reg in aliases:
-                return base_reg
-        
-        # If not found in aliases, return as-is
-        return reg
+        return self._norm.get(reg) or sys.intern(reg)
     
     def parse_operand(self, operand: str) -> Tuple[Set[str], Set[str], Optional[str]]:
         """
@@ -68,51 +123,61 @@ class GenericAssemblyParser:
             memory_location: Memory location if applicable
         """
         self._ensure_config()
-        
+
         operand = operand.strip()
+        cached = self._operand_cache.get(operand)
+        if cached is not None:
+            return cached
+
         reads = set()
         writes = set()
         memory_location = None
-        
-        # Handle memory operands using architecture-specific pattern
-        memory_pattern = self.config.memory_patterns["memory_operand"]
-        memory_match = re.search(memory_pattern, operand)
-        
-        if memory_match:
-            memory_expr = memory_match.group(1)
-            memory_location = f"[{memory_expr}]"
-            
+
+        # Handle memory operands: str.find for bracket syntax, otherwise the
+        # architecture-specific pattern
+        if self._bracket_memory:
+            lb = operand.find('[')
+            rb = operand.find(']', lb + 1) if lb != -1 else -1
+            memory_expr = operand[lb + 1:rb] if rb > lb + 1 else None
+        else:
+            memory_match = self._memory_re.search(operand)
+            memory_expr = memory_match.group(1) if memory_match else None
+
+        if memory_expr is not None:
+            # Interned like register names: the same address expression
+            # recurs across many instructions, and interning lets the
+            # dependency scan's dict lookups short-circuit on identity
+            memory_location = sys.intern(f"[{memory_expr}]")
+
             # Extract registers from memory expression
-            reg_pattern = self.config.memory_patterns["register"]
-            reg_matches = re.findall(reg_pattern, memory_expr, re.IGNORECASE)
-            
-            for reg in reg_matches:
-                reads.add(self.normalize_register(reg))
-            
+            for tok in self._tok_re.findall(memory_expr):
+                low = tok.lower()
+                if low in self._registers:
+                    reads.add(self._norm.get(low, low))
+
             # Handle architecture-specific mask operands (x86_64 AVX-512)
-            if "mask_register" in self.config.memory_patterns:
-                mask_pattern = self.config.memory_patterns["mask_register"]
-                mask_matches = re.findall(mask_pattern, operand, re.IGNORECASE)
+            if self._mask_re is not None:
+                mask_matches = self._mask_re.findall(operand)
                 for mask in mask_matches:
                     reads.add(self.normalize_register(mask))
-        
+
         # Handle direct register operands
         else:
             # Handle architecture-specific mask operands (x86_64 AVX-512)
-            if "mask_register" in self.config.memory_patterns:
-                mask_pattern = self.config.memory_patterns["mask_register"]
-                mask_matches = re.findall(mask_pattern, operand, re.IGNORECASE)
+            if self._mask_re is not None:
+                mask_matches = self._mask_re.findall(operand)
                 for mask in mask_matches:
                     reads.add(self.normalize_register(mask))
-            
+
             # Handle regular register operands
-            reg_pattern = self.config.memory_patterns["register"]
-            reg_matches = re.findall(reg_pattern, operand, re.IGNORECASE)
-            
-            for reg in reg_matches:
-                reads.add(self.normalize_register(reg))
-        
-        return reads, writes, memory_location
+            for tok in self._tok_re.findall(operand):
+                low = tok.lower()
+                if low in self._registers:
+                    reads.add(self._norm.get(low, low))
+
+        result = (reads, writes, memory_location)
+        self._operand_cache[operand] = result
+        return result
     
     def parse_instruction(self, line: str, line_num: int) -> Optional[Instruction]:
         """Parse a single assembly instruction line"""
@@ -137,7 +202,7 @@ class GenericAssemblyParser:
         if not parts:
             return None
         
-        opcode = parts[0].lower()
+        opcode = sys.intern(parts[0].lower())
         operands = []
         
         if len(parts) > 1:
@@ -147,28 +212,13 @@ class GenericAssemblyParser:
         
         return Instruction(line_num, label, opcode, operands, line)
     
+    # Runs of non-comma text where bracketed memory expressions may contain
+    # commas, e.g. "qword ptr [rax + rbx*2], rcx" -> two operands
+    _oper_split = re.compile(r'(?:[^,\[]|\[[^\]]*\])+')
+
     def _split_operands(self, operand_str: str) -> List[str]:
-        """Split operands by comma, handling nested brackets"""
-        operands = []
-        current = ""
-        bracket_depth = 0
-        
-        for char in operand_str:
-            if char == '[':
-                bracket_depth += 1
-            elif char == ']':
-                bracket_depth -= 1
-            elif char == ',' and bracket_depth == 0:
-                operands.append(current.strip())
-                current = ""
-                continue
-            
-            current += char
-        
-        if current.strip():
-            operands.append(current.strip())
-        
-        return operands
+        """Split operands by comma, keeping bracketed expressions intact"""
+        return [s.strip() for s in self._oper_split.findall(operand_str) if s.strip()]
     
     def get_architecture_info(self) -> Dict[str, str]:
         """Get information about the current architecture configuration"""
@@ -4,11 +4,11 @@ Data models for DFG analysis
 Contains the core data structures used throughout the DFG analyzer.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class Instruction:
     """Represents a single assembly instruction with its operands"""
     line_num: int
@@ -16,27 +16,35 @@ class Instruction:
     opcode: str
     operands: List[str]
     raw_line: str
-    
+    # (reads, writes, memory_ops) filled in lazily by the analyzer
+    _cached_rwm: Optional[tuple] = field(default=None, repr=False, compare=False)
+
     def __str__(self):
         prefix = f"{self.label}:\n" if self.label else ""
         return f"{prefix}{self.opcode} {', '.join(self.operands)}"
 
 
-@dataclass
-class DataDependency:
-    """Represents a data dependency between instructions"""
+class DataDependency(NamedTuple):
+    """Represents a data dependency between instructions
+
+    A plain tuple under the hood: dependency lists for large blocks can run
+    to tens of thousands of entries, and tuple storage keeps them compact.
+    """
     source_line: int
     target_line: int
     resource: str  # register name or memory location
     dependency_type: str  # 'RAW', 'WAR', 'WAW'
     operand_type: str  # 'register' or 'memory'
-    
+
     def __str__(self):
         return f"Line {self.source_line} -> Line {self.target_line} ({self.resource}, {self.dependency_type}, {self.operand_type})"
 
 
 # Legacy models for compatibility with ASCII visualizer
 class LegacyInstruction:
+    __slots__ = ('line_num', 'opcode', 'operands', 'full_text',
+                 'reads', 'writes', 'memory_address_reads')
+
     def __init__(self, line_num, opcode, operands, full_text):
         self.line_num = line_num
         self.opcode = opcode
@@ -48,6 +56,8 @@ class LegacyInstruction:
 
 
 class Dependency:
+    __slots__ = ('from_instr', 'to_instr', 'register', 'dep_type')
+
     def __init__(self, from_instr, to_instr, register, dep_type):
         self.from_instr = from_instr
         self.to_instr = to_instr
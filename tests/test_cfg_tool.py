@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Test CFG Tool Command-Line Behaviors
+
+Tests for the fast-path argument parser (including parity with the
+argparse definitions), the --cache CFG cache, and the JSON CSR encoding.
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Add repo root (for cfg_tool) and src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import cfg_tool
+from cfg_analyzer import AssemblyParserFactory, cfg_to_dict
+from cfg_analyzer.models import BasicBlock, ControlFlowGraph, Instruction
+
+
+SAMPLE_ASSEMBLY = """\t.type main, @function
+main:
+\tpush rbp
+\tcmp eax, 5
+\tjle .LBB0_2
+\tadd eax, 1
+\tjmp .LBB0_3
+.LBB0_2:
+\tsub eax, 1
+.LBB0_3:
+\tret
+.Lfunc_end0:
+"""
+
+OTHER_ASSEMBLY = """\t.type helper, @function
+helper:
+\tmov eax, 0
+\tret
+.Lfunc_end0:
+"""
+
+
+class TestFastParseParity(unittest.TestCase):
+    """The fast-path parser must agree with argparse whenever it answers"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.arg_parser = cfg_tool._build_arg_parser()
+
+    def _argparse_result(self, argv):
+        """Parse argv with argparse, returning None where argparse errors"""
+        with contextlib.redirect_stderr(io.StringIO()):
+            try:
+                return self.arg_parser.parse_args(argv)
+            except SystemExit:
+                return None
+
+    def assert_parity(self, argv):
+        fast = cfg_tool._fast_parse(argv)
+        if fast is None:
+            # Fast path defers to argparse; parity holds by construction
+            return
+        expected = self._argparse_result(argv)
+        self.assertIsNotNone(
+            expected,
+            f"fast path accepted {argv!r} but argparse rejects it")
+        self.assertEqual(
+            vars(fast), vars(expected),
+            f"fast path disagrees with argparse for {argv!r}")
+
+    def test_common_invocations(self):
+        """Typical command lines parse identically on both paths"""
+        cases = [
+            ['file.s'],
+            ['file.s', '-f', 'main'],
+            ['file.s', '-f', 'main', '-v'],
+            ['file.s', '--function', 'main', '--detailed'],
+            ['file.s', '-s', 'att', '-t', 'objdump'],
+            ['file.s', '--auto-detect', '--cache', '--json'],
+            ['file.s', '--export-all-dot', '--max-instructions', '3',
+             '-o', 'out', '--jobs', '2'],
+            ['-f', 'main', 'file.s', '--export-dot', '--no-instructions'],
+        ]
+        for argv in cases:
+            with self.subTest(argv=argv):
+                self.assert_parity(argv)
+
+    def test_option_like_value_rejected(self):
+        """An option token is never swallowed as a value (the -f --verbose bug)"""
+        self.assertIsNone(cfg_tool._fast_parse(['-f', '--verbose', 'file.s']))
+        self.assertIsNone(cfg_tool._fast_parse(['file.s', '-s', '-t']))
+        self.assertIsNone(cfg_tool._fast_parse(['file.s', '-o', '--cache']))
+
+    def test_negative_number_values_allowed(self):
+        """Negative numbers stay valid option values, as in argparse"""
+        for argv in [['file.s', '--max-instructions', '-5'],
+                     ['file.s', '--jobs', '-1']]:
+            with self.subTest(argv=argv):
+                fast = cfg_tool._fast_parse(argv)
+                self.assertIsNotNone(fast)
+                self.assert_parity(argv)
+
+    def test_fallback_cases_return_none(self):
+        """Anything the fast path cannot mirror is left to argparse"""
+        for argv in [[],                          # missing file
+                     ['--help'],                  # argparse feature
+                     ['file.s', '--syntax=att'],  # '=' form
+                     ['file.s', '--verb'],        # abbreviation
+                     ['file.s', 'extra.s'],       # second positional
+                     ['file.s', '-f'],            # missing value
+                     ['file.s', '-s', 'bogus'],   # invalid choice
+                     ['file.s', '--jobs', 'abc'],  # invalid int
+                     ['file.s', '--']]:           # separator
+            with self.subTest(argv=argv):
+                self.assertIsNone(cfg_tool._fast_parse(argv))
+
+    def test_random_sweep(self):
+        """Randomized token sequences never produce a divergent accept"""
+        pool = ['file.s', 'other.s', 'main', 'att', 'intel', 'objdump',
+                'assembly', '5', '-5', 'abc', 'out',
+                '-f', '--function', '-s', '--syntax', '-t', '--type',
+                '-v', '--verbose', '--detailed', '--auto-detect',
+                '--export-dot', '--export-all-dot', '--no-instructions',
+                '--max-instructions', '-o', '--output-dir', '--jobs',
+                '--cache', '--json', '--unknown', '--', '-']
+        rng = random.Random(1234)
+        for _ in range(2000):
+            argv = [rng.choice(pool) for _ in range(rng.randint(0, 6))]
+            with self.subTest(argv=argv):
+                self.assert_parity(argv)
+
+
+class TestCfgCache(unittest.TestCase):
+    """Behavior of the --cache pickle cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.old_cache_home = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = str(Path(self.tmp.name) / "cache")
+
+        def restore():
+            if self.old_cache_home is None:
+                os.environ.pop("XDG_CACHE_HOME", None)
+            else:
+                os.environ["XDG_CACHE_HOME"] = self.old_cache_home
+        self.addCleanup(restore)
+
+        self.asm_file = Path(self.tmp.name) / "sample.s"
+        self.asm_file.write_text(SAMPLE_ASSEMBLY)
+        self.parser = AssemblyParserFactory.create_parser("intel")
+
+    def _cache_files(self):
+        cache_dir = Path(os.environ["XDG_CACHE_HOME"]) / "bakasur"
+        return sorted(cache_dir.glob("*.pkl")) if cache_dir.exists() else []
+
+    def test_cache_round_trip(self):
+        """A second cached parse loads the pickled CFGs without reparsing"""
+        first = cfg_tool._parse_file_cached(
+            self.parser, str(self.asm_file), "intel", "assembly", use_cache=True)
+        self.assertIn("main", first)
+        self.assertEqual(len(self._cache_files()), 1)
+
+        # A parser that cannot parse proves the second call is a cache hit
+        class ExplodingParser:
+            def parse_file_with_cfg(self, file_path):
+                raise AssertionError("cache miss: parse_file_with_cfg called")
+
+        second = cfg_tool._parse_file_cached(
+            ExplodingParser(), str(self.asm_file), "intel", "assembly", use_cache=True)
+        self.assertEqual(set(second.keys()), set(first.keys()))
+        cfg = second["main"]
+        self.assertEqual(set(cfg.basic_blocks.keys()),
+                         set(first["main"].basic_blocks.keys()))
+        self.assertEqual(cfg.entry_block, first["main"].entry_block)
+
+    def test_cache_invalidated_on_file_change(self):
+        """Modifying the input file must not serve the stale entry"""
+        first = cfg_tool._parse_file_cached(
+            self.parser, str(self.asm_file), "intel", "assembly", use_cache=True)
+        self.assertIn("main", first)
+
+        self.asm_file.write_text(OTHER_ASSEMBLY)
+        second = cfg_tool._parse_file_cached(
+            self.parser, str(self.asm_file), "intel", "assembly", use_cache=True)
+        self.assertIn("helper", second)
+        self.assertNotIn("main", second)
+
+    def test_cache_key_includes_syntax(self):
+        """The same file parsed under another syntax gets its own entry"""
+        intel_path = cfg_tool._cfg_cache_path(str(self.asm_file), "intel", "assembly")
+        att_path = cfg_tool._cfg_cache_path(str(self.asm_file), "att", "assembly")
+        self.assertNotEqual(intel_path, att_path)
+
+    def test_corrupt_cache_entry_falls_back_to_reparse(self):
+        """A damaged pickle is ignored, not fatal"""
+        cfg_tool._parse_file_cached(
+            self.parser, str(self.asm_file), "intel", "assembly", use_cache=True)
+        cache_file = self._cache_files()[0]
+        cache_file.write_bytes(b"not a pickle")
+
+        result = cfg_tool._parse_file_cached(
+            self.parser, str(self.asm_file), "intel", "assembly", use_cache=True)
+        self.assertIn("main", result)
+
+    def test_no_cache_written_without_flag(self):
+        """use_cache=False leaves the cache directory untouched"""
+        result = cfg_tool._parse_file_cached(
+            self.parser, str(self.asm_file), "intel", "assembly", use_cache=False)
+        self.assertIn("main", result)
+        self.assertEqual(self._cache_files(), [])
+
+
+class TestCfgToDict(unittest.TestCase):
+    """The JSON payload's CSR successor encoding"""
+
+    def _make_cfg(self):
+        cfg = ControlFlowGraph("f", "entry")
+        for label, start, end in [("entry", 1, 3), ("loop", 4, 6), ("exit", 7, 8)]:
+            block = BasicBlock(label, start, end)
+            block.instructions = [
+                Instruction(start, "nop", "", "nop")
+                for _ in range(end - start + 1)]
+            cfg.basic_blocks[label] = block
+        cfg.add_edge("entry", "loop")
+        cfg.add_edge("loop", "loop")
+        cfg.add_edge("loop", "exit")
+        return cfg
+
+    def test_csr_encoding_round_trip(self):
+        """succ_indptr/succ_indices decode back to the successor sets"""
+        cfg = self._make_cfg()
+        payload = cfg_to_dict(cfg)
+
+        self.assertEqual(payload["function"], "f")
+        self.assertEqual(payload["entry"], "entry")
+        blocks = payload["blocks"]
+        labels = blocks["labels"]
+        self.assertEqual(set(labels), set(cfg.basic_blocks.keys()))
+
+        indptr = blocks["succ_indptr"]
+        indices = blocks["succ_indices"]
+        self.assertEqual(len(indptr), len(labels) + 1)
+        self.assertEqual(indptr[0], 0)
+        self.assertEqual(indptr[-1], len(indices))
+        self.assertEqual(indptr, sorted(indptr))  # monotonic
+
+        for i, label in enumerate(labels):
+            row = indices[indptr[i]:indptr[i + 1]]
+            self.assertEqual(row, sorted(row))
+            decoded = {labels[j] for j in row}
+            self.assertEqual(decoded, cfg.basic_blocks[label].successors)
+
+    def test_block_columns_align(self):
+        """Parallel block columns line up with the label order"""
+        cfg = self._make_cfg()
+        blocks = cfg_to_dict(cfg)["blocks"]
+        for i, label in enumerate(blocks["labels"]):
+            block = cfg.basic_blocks[label]
+            self.assertEqual(blocks["start_lines"][i], block.start_line)
+            self.assertEqual(blocks["end_lines"][i], block.end_line)
+            self.assertEqual(blocks["instruction_counts"][i],
+                             len(block.instructions))
+
+    def test_payload_is_json_serializable(self):
+        """The dict for a parsed function serializes with the stdlib encoder"""
+        with tempfile.NamedTemporaryFile("w", suffix=".s", delete=False) as f:
+            f.write(SAMPLE_ASSEMBLY)
+            path = f.name
+        self.addCleanup(os.unlink, path)
+
+        parser = AssemblyParserFactory.create_parser("intel")
+        cfgs = parser.parse_file_with_cfg(path)
+        self.assertIn("main", cfgs)
+        payload = {name: cfg_to_dict(c) for name, c in cfgs.items()}
+        decoded = json.loads(json.dumps(payload))
+        self.assertEqual(decoded["main"]["blocks"]["labels"],
+                         cfg_to_dict(cfgs["main"])["blocks"]["labels"])
+
+
+if __name__ == '__main__':
+    unittest.main()